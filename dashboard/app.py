@@ -200,9 +200,8 @@ with st.sidebar.expander("System", expanded=False):
             progress_bar.empty()
     with col_act2:
         if st.button("Refresh Prices", key="refresh_prices_btn"):
-            for key in ["live_prices", "live_prices_ts"]:
-                if key in st.session_state:
-                    del st.session_state[key]
+            from dashboard.views.portfolio import _cached_live_prices
+            _cached_live_prices.clear()
             st.rerun()
 
 # Market bar at top of every page
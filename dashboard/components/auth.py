@@ -109,8 +109,7 @@ def logout_button():
             except Exception:
                 pass
         # Clear client state
-        for key in ["user_id", "username", "session_token",
-                     "risk_report", "live_prices", "live_prices_ts"]:
+        for key in ["user_id", "username", "session_token", "risk_report"]:
             st.session_state.pop(key, None)
         if "token" in st.query_params:
             del st.query_params["token"]
@@ -306,6 +306,33 @@ def inject_theme():
         border-color: #363A45;
     }
 
+    /* Compact metric grid (single-markdown alternative to st.columns + st.metric) */
+    .metrics-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+        gap: 16px;
+        margin: 8px 0 16px 0;
+    }
+    .metrics-grid .metric-label {
+        color: #787B86;
+        font-size: 0.8rem;
+        font-weight: 500;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+    .metrics-grid .metric-value {
+        color: #D1D4DC;
+        font-size: 1.6rem;
+        font-weight: 600;
+        line-height: 1.3;
+    }
+    .metrics-grid .metric-delta {
+        font-size: 0.85rem;
+        font-weight: 600;
+    }
+    .metrics-grid .metric-delta.up { color: #26A69A; }
+    .metrics-grid .metric-delta.down { color: #EF5350; }
+
     /* API key status cards */
     .api-key-card {
         background: #1E222D;
@@ -62,7 +62,7 @@ def _render_scanner_tab(user_id: int):
         quick_screen = st.checkbox("Quick Screen", value=True, key="discover_quick",
                                    help="Fetch basic info without full analysis")
 
-    tickers_to_scan = STOCK_UNIVERSES.get(scan_source, [])[:max_stocks]
+    tickers_to_scan = STOCK_UNIVERSES.get(scan_source, ())[:max_stocks]
 
     if st.button("Scan Now", type="primary", key="discover_scan"):
         if quick_screen:
@@ -283,7 +283,7 @@ def _render_news_tab(user_id: int):
     """Market News tab — imports from news.py rendering logic."""
     from dashboard.views.news import (
         _fetch_yfinance_news, _store_articles, _dedupe_and_sort,
-        _render_article_card, _is_credible, MARKET_TICKERS,
+        _render_article_cards, _is_credible, MARKET_TICKERS,
     )
 
     db = get_connection()
@@ -317,8 +317,7 @@ def _render_news_tab(user_id: int):
     market_articles = _dedupe_and_sort(market_articles)
 
     if market_articles:
-        for article in market_articles[:20]:
-            _render_article_card(article, show_credibility=True)
+        _render_article_cards(market_articles[:20], show_credibility=True)
     else:
         st.info("No market news cached yet. Click 'Refresh News' to fetch headlines.")
 
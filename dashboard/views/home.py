@@ -1,12 +1,93 @@
 """Home Dashboard — Portfolio overview and insights."""
 
+from functools import lru_cache
+
 import streamlit as st
 import pandas as pd
 
-from database.models import PortfolioDAO, DecisionDAO, UserWatchlistDAO
+from database.connection import get_connection
+from database.models import PortfolioDAO, DecisionDAO, StockDAO, UserWatchlistDAO
 from dashboard.components.auth import get_current_user_id
 
 
+# Static / templated HTML blocks, built once at import instead of on every rerun
+_HERO_TMPL = """
+<div style="text-align: center; padding: 20px 0 10px 0;">
+    <div style="font-size: 0.9rem; color: #94a3b8; text-transform: uppercase;
+                letter-spacing: 2px; margin-bottom: 8px;">Portfolio Value</div>
+    <div style="font-size: 3rem; font-weight: 800; color: #f59e0b;
+                line-height: 1.1;">${total_value:,.0f}</div>
+    <div style="font-size: 1.2rem; color: {pl_color}; margin-top: 4px;">
+        {pl_arrow}${total_pl:,.0f} ({pl_arrow}{total_pl_pct:.1f}%) all-time
+    </div>
+</div>
+"""
+
+_METRIC_CELL_TMPL = (
+    '<div><div class="metric-label">{label}</div>'
+    '<div class="metric-value">{value}</div>{delta}</div>'
+)
+_METRIC_DELTA_TMPL = '<div class="metric-delta {direction}">{delta}</div>'
+
+_WELCOME_HTML = """
+<div style="text-align: center; padding: 40px 20px 20px;">
+    <div style="font-size: 3rem; margin-bottom: 12px;">&#127913;</div>
+    <h2 style="color: #f59e0b; margin-bottom: 4px;">Welcome to The Mad Hatter</h2>
+    <p style="color: #94a3b8; font-size: 1.05rem; max-width: 500px; margin: 0 auto;">
+        Your personal trading dashboard. Let's get you set up.
+    </p>
+</div>
+"""
+
+_SETUP_PORTFOLIO_HTML = """
+<div class="setup-card">
+    <div style="font-size: 1.5rem; margin-bottom: 8px;">1&#65039;&#8419;</div>
+    <div style="font-size: 1.1rem; font-weight: 700; color: #a78bfa; margin-bottom: 8px;">
+        Add Your Portfolio
+    </div>
+    <div style="color: #94a3b8; font-size: 0.9rem;">
+        Enter your holdings to get personalized insights and track performance.
+    </div>
+</div>
+"""
+
+_SETUP_NEWS_HTML = """
+<div class="setup-card">
+    <div style="font-size: 1.5rem; margin-bottom: 8px;">2&#65039;&#8419;</div>
+    <div style="font-size: 1.1rem; font-weight: 700; color: #a78bfa; margin-bottom: 8px;">
+        Browse News & Markets
+    </div>
+    <div style="color: #94a3b8; font-size: 0.9rem;">
+        Stay informed with curated financial news, video, and economic data from trusted sources.
+    </div>
+</div>
+"""
+
+
+@st.cache_resource
+def _portfolio_dao() -> PortfolioDAO:
+    """Shared PortfolioDAO for all sessions (DAOs only wrap the singleton connection)."""
+    return PortfolioDAO()
+
+
+@st.cache_resource
+def _stock_dao() -> StockDAO:
+    """Shared StockDAO for all sessions."""
+    return StockDAO()
+
+
+@lru_cache(maxsize=1)
+def _portfolio_helpers():
+    """Resolve the portfolio page helpers once (deferred: that module pulls in yfinance).
+
+    Returns (_fetch_and_build_holding, _merge_and_snapshot, _get_live_prices, _apply_live_prices).
+    """
+    from dashboard.views.portfolio import (
+        _fetch_and_build_holding, _merge_and_snapshot, _get_live_prices, _apply_live_prices,
+    )
+    return _fetch_and_build_holding, _merge_and_snapshot, _get_live_prices, _apply_live_prices
+
+
 def _safe_val(v, default=0):
     """Safely convert to float, returning default if None/NaN."""
     try:
@@ -25,37 +106,37 @@ def _render_portfolio_hero(holdings: list[dict]):
     total_pl = sum(_safe_val(h.get("unrealized_pl")) for h in holdings)
     total_pl_pct = (total_pl / total_cost * 100) if total_cost > 0 else 0
 
-    sectors = set(h.get("sector", "Unknown") for h in holdings if h.get("sector"))
+    df = pd.DataFrame(holdings)
+    n_sectors = df["sector"].replace("", pd.NA).dropna().nunique() if "sector" in df else 0
     winners = sum(1 for h in holdings if _safe_val(h.get("unrealized_pl")) > 0)
     best = max(holdings, key=lambda h: _safe_val(h.get("unrealized_pl_pct")), default=None)
 
     pl_color = "#10b981" if total_pl >= 0 else "#ef4444"
     pl_arrow = "+" if total_pl >= 0 else ""
 
-    st.markdown(f"""
-    <div style="text-align: center; padding: 20px 0 10px 0;">
-        <div style="font-size: 0.9rem; color: #94a3b8; text-transform: uppercase;
-                    letter-spacing: 2px; margin-bottom: 8px;">Portfolio Value</div>
-        <div style="font-size: 3rem; font-weight: 800; color: #f59e0b;
-                    line-height: 1.1;">${total_value:,.0f}</div>
-        <div style="font-size: 1.2rem; color: {pl_color}; margin-top: 4px;">
-            {pl_arrow}${total_pl:,.0f} ({pl_arrow}{total_pl_pct:.1f}%) all-time
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Positions", len(holdings))
-    with col2:
-        st.metric("Sectors", len(sectors))
-    with col3:
-        st.metric("Winners", f"{winners}/{len(holdings)}")
-    with col4:
-        if best:
-            st.metric("Best", best["ticker"],
-                      delta=f"{_safe_val(best.get('unrealized_pl_pct')):+.1f}%")
-
+    cells = [
+        _METRIC_CELL_TMPL.format(label="Positions", value=len(holdings), delta=""),
+        _METRIC_CELL_TMPL.format(label="Sectors", value=n_sectors, delta=""),
+        _METRIC_CELL_TMPL.format(label="Winners", value=f"{winners}/{len(holdings)}", delta=""),
+    ]
+    if best:
+        best_pct = _safe_val(best.get("unrealized_pl_pct"))
+        cells.append(_METRIC_CELL_TMPL.format(
+            label="Best", value=best["ticker"],
+            delta=_METRIC_DELTA_TMPL.format(direction="up" if best_pct >= 0 else "down",
+                                            delta=f"{best_pct:+.1f}%"),
+        ))
+
+    # Hero + metric grid go out as one element instead of a markdown plus four st.metric widgets
+    hero = _HERO_TMPL.format_map({
+        "total_value": total_value,
+        "total_pl": total_pl,
+        "total_pl_pct": total_pl_pct,
+        "pl_color": pl_color,
+        "pl_arrow": pl_arrow,
+    })
+    st.markdown(hero + f'<div class="metrics-grid">{"".join(cells)}</div>',
+                unsafe_allow_html=True)
 
 
 def _render_quick_add(portfolio_dao, stock_dao, user_id: int):
@@ -63,7 +144,6 @@ def _render_quick_add(portfolio_dao, stock_dao, user_id: int):
     st.caption("Quick Add Holdings")
 
     # Build ticker list from DB + popular
-    from database.connection import get_connection
     _popular = [
         "AAPL", "MSFT", "AMZN", "NVDA", "GOOGL", "META", "TSLA", "JPM", "V",
         "HD", "KO", "PEP", "AVGO", "COST", "AMD", "NFLX", "SPY", "QQQ", "VOO",
@@ -102,7 +182,7 @@ def _render_quick_add(portfolio_dao, stock_dao, user_id: int):
             else:
                 with st.spinner(f"Adding {ticker}..."):
                     try:
-                        from dashboard.views.portfolio import _fetch_and_build_holding, _merge_and_snapshot
+                        _fetch_and_build_holding, _merge_and_snapshot, _, _ = _portfolio_helpers()
                         holding = _fetch_and_build_holding(ticker, shares, cost if cost > 0 else 0)
                         info = holding.pop("_info")
                         _merge_and_snapshot(portfolio_dao, holding, user_id)
@@ -144,30 +224,12 @@ def _render_holdings_mini(holdings: list[dict]):
 
 def _render_empty_state(portfolio_dao, stock_dao, user_id: int):
     """Render the guided empty state with two setup cards."""
-    st.markdown("""
-    <div style="text-align: center; padding: 40px 20px 20px;">
-        <div style="font-size: 3rem; margin-bottom: 12px;">&#127913;</div>
-        <h2 style="color: #f59e0b; margin-bottom: 4px;">Welcome to The Mad Hatter</h2>
-        <p style="color: #94a3b8; font-size: 1.05rem; max-width: 500px; margin: 0 auto;">
-            Your personal trading dashboard. Let's get you set up.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
 
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown("""
-        <div class="setup-card">
-            <div style="font-size: 1.5rem; margin-bottom: 8px;">1&#65039;&#8419;</div>
-            <div style="font-size: 1.1rem; font-weight: 700; color: #a78bfa; margin-bottom: 8px;">
-                Add Your Portfolio
-            </div>
-            <div style="color: #94a3b8; font-size: 0.9rem;">
-                Enter your holdings to get personalized insights and track performance.
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SETUP_PORTFOLIO_HTML, unsafe_allow_html=True)
 
         portfolio_text = st.text_area(
             "Enter holdings",
@@ -181,10 +243,10 @@ def _render_empty_state(portfolio_dao, stock_dao, user_id: int):
                 from utils.portfolio_parser import parse_portfolio_text
                 parsed = parse_portfolio_text(portfolio_text)
                 if parsed:
+                    _fetch_and_build_holding, _merge_and_snapshot, _, _ = _portfolio_helpers()
                     imported = 0
                     for row in parsed:
                         try:
-                            from dashboard.views.portfolio import _fetch_and_build_holding, _merge_and_snapshot
                             holding = _fetch_and_build_holding(row["ticker"], row["shares"], row["cost"])
                             info = holding.pop("_info")
                             _merge_and_snapshot(portfolio_dao, holding, user_id)
@@ -205,17 +267,7 @@ def _render_empty_state(portfolio_dao, stock_dao, user_id: int):
                     st.error("Could not parse. Use format: `AAPL 100 @ 150`")
 
     with col2:
-        st.markdown("""
-        <div class="setup-card">
-            <div style="font-size: 1.5rem; margin-bottom: 8px;">2&#65039;&#8419;</div>
-            <div style="font-size: 1.1rem; font-weight: 700; color: #a78bfa; margin-bottom: 8px;">
-                Browse News & Markets
-            </div>
-            <div style="color: #94a3b8; font-size: 0.9rem;">
-                Stay informed with curated financial news, video, and economic data from trusted sources.
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SETUP_NEWS_HTML, unsafe_allow_html=True)
 
         col_a, col_b = st.columns(2)
         with col_a:
@@ -235,9 +287,8 @@ def render():
         st.warning("Please log in to view your dashboard.")
         return
 
-    from database.models import StockDAO
-    portfolio_dao = PortfolioDAO()
-    stock_dao = StockDAO()
+    portfolio_dao = _portfolio_dao()
+    stock_dao = _stock_dao()
     holdings = list(portfolio_dao.get_latest_holdings(user_id))
 
     if not holdings:
@@ -245,7 +296,7 @@ def render():
         return
 
     # Refresh with live prices
-    from dashboard.views.portfolio import _get_live_prices, _apply_live_prices
+    _, _, _get_live_prices, _apply_live_prices = _portfolio_helpers()
     tickers = [h["ticker"] for h in holdings]
     live_prices = _get_live_prices(tickers)
     if live_prices:
@@ -1,7 +1,13 @@
 """Macro & Market Dashboard Page."""
 
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 
 from database.models import MacroDAO
 from analysis.macroeconomic import MacroeconomicAnalyzer
@@ -10,55 +16,284 @@ from dashboard.components.tables import macro_indicators_table
 from dashboard.data.market_data import get_key_economic_indicators
 from collectors.fred_collector import FRED_SERIES
 
+# Series drawn by the market chart section of render(), with a lookback of
+# about one year at each series' frequency (STLFSI4 is weekly)
+_CHART_SERIES = {
+    "T10Y2Y": 252,
+    "BAMLH0A0HYM2": 252,
+    "STLFSI4": 52,
+    "VIXCLS": 252,
+}
+
+
+# Sparkline colors for the key Fed indicators
+_INDICATOR_COLORS = {
+    "ICSA": "#2962FF",
+    "CPIAUCSL": "#EF5350",
+    "UNRATE": "#FF9800",
+    "FEDFUNDS": "#26A69A",
+    "UMCSENT": "#AB47BC",
+    "GDP": "#26A69A",
+}
+
+
+# (series_id, title, color) for each panel of the 2x2 market chart
+_MARKET_PANELS = (
+    ("T10Y2Y", "10Y-2Y Treasury Spread (%)", "cyan"),
+    ("BAMLH0A0HYM2", "ICE BofA HY Spread (%)", "red"),
+    ("STLFSI4", "St. Louis Fed FSI", "orange"),
+    ("VIXCLS", "CBOE VIX", "purple"),
+)
+
+# Fed Data Explorer dropdown and date-range choices
+_SERIES_OPTIONS = {f"{name} ({sid})": sid for sid, (name, _) in FRED_SERIES.items()}
+_SERIES_OPTIONS_KEYS = list(_SERIES_OPTIONS)
+_RANGE_OPTIONS = {"1 Year": 252, "2 Years": 504, "5 Years": 1260, "10 Years": 2520, "All": 5000}
+_RANGE_OPTIONS_KEYS = list(_RANGE_OPTIONS)
+
+# Rows per page of the explorer's raw data table
+_RAW_PAGE_SIZE = 200
+
+
+@st.cache_resource
+def _macro_dao() -> MacroDAO:
+    """Shared MacroDAO for all sessions (DAOs only wrap the singleton connection)."""
+    return MacroDAO()
+
+
+@st.cache_resource
+def _macro_analyzer() -> MacroeconomicAnalyzer:
+    """Shared MacroeconomicAnalyzer; it holds no per-call state beyond its DAOs."""
+    return MacroeconomicAnalyzer()
+
 
 @st.cache_data(ttl=3600, show_spinner=False)
 def _cached_regimes() -> dict:
     """Detect macro regimes (cached 1 hour)."""
-    analyzer = MacroeconomicAnalyzer()
-    return analyzer._detect_regimes()
+    return _macro_analyzer()._detect_regimes()
+
+
+def _regimes_key(regimes: dict) -> int | str:
+    """Small cache key for a regimes dict.
+
+    Regime values are flat scalars, so an order-independent frozenset hash
+    is enough. A blake2b digest of the pickle covers any unhashable value.
+    """
+    try:
+        return hash(frozenset(regimes.items()))
+    except TypeError:
+        return hashlib.blake2b(pickle.dumps(regimes, protocol=5), digest_size=8).hexdigest()
 
 
 @st.cache_data(ttl=3600, show_spinner=False)
-def _cached_dalio_quadrant(regimes_key: str) -> dict | None:
-    """Detect Dalio quadrant from regimes (cached 1 hour)."""
-    analyzer = MacroeconomicAnalyzer()
-    regimes = analyzer._detect_regimes()
-    return analyzer._detect_dalio_quadrant(regimes)
+def _cached_dalio_quadrant(regimes_key: int | str, _regimes: dict) -> dict | None:
+    """Detect Dalio quadrant from already-detected regimes (cached 1 hour).
+
+    Only regimes_key is hashed; the leading underscore tells Streamlit to
+    skip hashing the regimes dict itself.
+    """
+    return _macro_analyzer()._detect_dalio_quadrant(_regimes)
 
 
 @st.cache_data(ttl=3600, show_spinner=False)
-def _cached_recession_probability(regimes_key: str) -> float | None:
-    """Calculate recession probability (cached 1 hour)."""
-    analyzer = MacroeconomicAnalyzer()
-    regimes = analyzer._detect_regimes()
-    return analyzer._calculate_recession_probability(regimes)
+def _cached_recession_probability(regimes_key: int | str, _regimes: dict) -> float | None:
+    """Calculate recession probability from already-detected regimes (cached 1 hour)."""
+    return _macro_analyzer()._calculate_recession_probability(_regimes)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_macro_series(series_id: str, limit: int = 252,
+                         version: str | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Fetch a FRED macro series as (dates, values) arrays, oldest first (cached 1 hour).
+
+    version (the series' last fetched_at) is only part of the cache key, so
+    newly ingested data is picked up without waiting out the TTL.
+    """
+    return _macro_dao().get_series_columns(series_id, limit=limit)
+
+
+def _decimate(dates: np.ndarray, values: np.ndarray,
+              target: int = 500) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to ~target points with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    mean, so peaks and troughs survive. Series at or under target are
+    returned unchanged.
+    """
+    n = len(values)
+    if n <= target or target < 3:
+        return dates, values
+
+    y = values.astype(np.float64)
+    keep = np.empty(target, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    # target - 2 buckets spanning the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, target - 1).astype(np.intp)
+    a = 0
+    for i in range(target - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = (hi + next_hi - 1) / 2.0
+        avg_y = y[hi:next_hi].mean()
+        xs = np.arange(lo, hi)
+        area = np.abs((a - avg_x) * (y[lo:hi] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return dates[keep], values[keep]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _chart_series_version() -> str:
+    """Latest fetched_at across the chart series (cached 5 minutes).
+
+    Keys _cached_chart_series, so newly ingested data shows up within a few
+    minutes without a freshness query on every rerun.
+    """
+    try:
+        versions = _macro_dao().get_last_fetched(list(_CHART_SERIES))
+    except Exception:
+        return ""
+    return max((v or "" for v in versions.values()), default="")
 
 
 @st.cache_data(ttl=3600, show_spinner=False)
-def _cached_macro_series(series_id: str, limit: int = 252) -> list[dict]:
-    """Fetch a FRED macro series from the database (cached 1 hour)."""
-    macro_dao = MacroDAO()
-    return list(macro_dao.get_series(series_id, limit=limit))
+def _cached_chart_series(version: str) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Fetch every chart series as {series_id: (dates, values)} (cached 1 hour).
+
+    Only a cache miss reaches the database, reading the series concurrently
+    so a cold cache costs one round of reads. The workers call the DAO
+    directly and never touch Streamlit. version works as in
+    _cached_macro_series.
+    """
+    empty = (np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float32))
+    dao = _macro_dao()
+    with ThreadPoolExecutor(max_workers=len(_CHART_SERIES)) as ex:
+        futures = {sid: ex.submit(dao.get_series_columns, sid, limit)
+                   for sid, limit in _CHART_SERIES.items()}
+    results = {}
+    for sid, future in futures.items():
+        try:
+            results[sid] = future.result()
+        except Exception:
+            results[sid] = empty
+    return _align_start(results)
+
+
+def _align_start(series: dict[str, tuple[np.ndarray, np.ndarray]]) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Trim oldest-first series to the latest first date among them.
+
+    The market panels share one x-axis, so every series has to cover the
+    same period or the shorter ones get squeezed into part of their panel.
+    Empty series are left as they are.
+    """
+    starts = [dates[0] for dates, _ in series.values() if len(dates)]
+    if not starts:
+        return series
+    start = max(starts)
+    trimmed = {}
+    for sid, (dates, values) in series.items():
+        i = np.searchsorted(dates, start)
+        trimmed[sid] = (dates[i:], values[i:])
+    return trimmed
+
+
+def _prefetch_chart_series() -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """Chart series for the market section; warm reruns are two cache lookups."""
+    return _cached_chart_series(_chart_series_version())
 
 
-def _mini_sparkline(values: list, color: str = "#2962FF") -> go.Figure:
-    """Create a tiny inline Plotly sparkline chart."""
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_explorer_figure(dates: np.ndarray, values: np.ndarray, series_name: str) -> go.Figure:
+    """Build the Fed Data Explorer chart (cached on the series arrays)."""
+    dates, values = _decimate(dates, values)
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        y=values,
-        mode="lines",
-        line=dict(color=color, width=1.5),
+    fig.add_trace(go.Scattergl(
+        x=dates, y=values,
+        name=series_name,
+        line=dict(color="#2962FF", width=2),
         fill="tozeroy",
-        fillcolor=f"rgba({_hex_to_rgb(color)}, 0.1)",
+        fillcolor="rgba(41, 98, 255, 0.08)",
     ))
     fig.update_layout(
-        height=50, width=150,
+        title=series_name,
+        xaxis_title="Date",
+        yaxis_title="Value",
+        height=400,
+        template="plotly_dark",
+    )
+    return fig
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _build_market_figure(series: tuple[tuple[np.ndarray, np.ndarray], ...]) -> go.Figure:
+    """Build the yield curve / credit / stress / VIX panel as one 2x2 figure.
+
+    series follows _MARKET_PANELS order and covers a common period (see
+    _align_start); empty series leave their panel blank. The x-axes are
+    shared so zooming one panel zooms them all.
+    """
+    fig = make_subplots(rows=2, cols=2, shared_xaxes="all", vertical_spacing=0.12,
+                        subplot_titles=[title for _, title, _ in _MARKET_PANELS])
+    for i, ((dates, values), (_, title, color)) in enumerate(zip(series, _MARKET_PANELS)):
+        if not len(values):
+            continue
+        dates, values = _decimate(dates, values)
+        row, col = divmod(i, 2)
+        trace = dict(x=dates, y=values, name=title, line=dict(color=color, width=2))
+        if i == 0:
+            trace.update(fill="tozeroy", fillcolor="rgba(0,200,200,0.1)")
+        fig.add_trace(go.Scattergl(**trace), row=row + 1, col=col + 1)
+    fig.add_hline(y=0, line_dash="dash", line_color="red",
+                  annotation_text="Inversion Threshold", row=1, col=1)
+    fig.update_layout(
+        height=550, template="plotly_dark", showlegend=False,
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    return fig
+
+
+def _quantize_sparkline(values) -> np.ndarray:
+    """Rescale a sparkline to int8 in [0, 127].
+
+    A 50px-tall sparkline only needs its shape, and Plotly ships int8
+    arrays as one byte per point instead of four. Non-finite points are
+    dropped.
+    """
+    v = np.asarray(values, dtype=np.float32)
+    v = v[np.isfinite(v)]
+    span = np.ptp(v) if v.size else 0
+    if not span:
+        return np.zeros(v.size, dtype=np.int8)
+    return np.rint((v - v.min()) * (127 / span)).astype(np.int8)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _sparkline_row(sparklines: list[list | None], colors: list[str]) -> go.Figure:
+    """Create one figure holding a row of tiny sparklines (cached on values and colors).
+
+    One subplot per metric column; a None entry leaves its slot blank.
+    """
+    fig = make_subplots(rows=1, cols=len(sparklines), horizontal_spacing=0.04)
+    for col, (values, color) in enumerate(zip(sparklines, colors), start=1):
+        if values is None:
+            continue
+        fig.add_trace(go.Scatter(
+            y=_quantize_sparkline(values),
+            mode="lines",
+            line=dict(color=color, width=1.5),
+            fill="tozeroy",
+            fillcolor=_FILL_RGBA.get(color) or f"rgba({_hex_to_rgb(color)}, 0.1)",
+            hoverinfo="skip",
+        ), row=1, col=col)
+    fig.update_xaxes(visible=False)
+    fig.update_yaxes(visible=False)
+    fig.update_layout(
+        height=50,
         margin=dict(l=0, r=0, t=0, b=0),
         template="plotly_dark",
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)",
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False),
         showlegend=False,
     )
     return fig
@@ -71,6 +306,10 @@ def _hex_to_rgb(hex_color: str) -> str:
     return f"{r}, {g}, {b}"
 
 
+# Sparkline fill colors for the fixed palette, computed once at import
+_FILL_RGBA = {c: f"rgba({_hex_to_rgb(c)}, 0.1)" for c in {"#2962FF", *_INDICATOR_COLORS.values()}}
+
+
 def _render_fed_indicators():
     """Render the key Fed economic indicators as a 3x2 metric grid."""
     indicators = get_key_economic_indicators()
@@ -79,16 +318,8 @@ def _render_fed_indicators():
         st.info("No economic data available. Run: `python main.py collect --source fred`")
         return
 
-    # Define display order and colors
+    # Define display order
     indicator_order = ["ICSA", "CPIAUCSL", "UNRATE", "FEDFUNDS", "UMCSENT", "GDP"]
-    colors = {
-        "ICSA": "#2962FF",
-        "CPIAUCSL": "#EF5350",
-        "UNRATE": "#FF9800",
-        "FEDFUNDS": "#26A69A",
-        "UMCSENT": "#AB47BC",
-        "GDP": "#26A69A",
-    }
 
     # 3x2 grid
     rows = [indicator_order[:3], indicator_order[3:]]
@@ -122,76 +353,73 @@ def _render_fed_indicators():
                     delta=delta_str,
                 )
 
-                # Sparkline
-                if data.get("sparkline") and len(data["sparkline"]) > 2:
-                    fig = _mini_sparkline(data["sparkline"], colors.get(series_id, "#2962FF"))
-                    st.plotly_chart(fig, config={"displayModeBar": False}, key=f"spark_{series_id}")
-
                 if data.get("date"):
                     st.caption(f"As of {data['date']}")
 
+        # Sparklines for the whole row in a single chart
+        sparklines = []
+        for series_id in row_ids:
+            spark = (indicators.get(series_id) or {}).get("sparkline")
+            sparklines.append(spark if spark and len(spark) > 2 else None)
+        if any(sparklines):
+            colors = [_INDICATOR_COLORS.get(sid, "#2962FF") for sid in row_ids]
+            st.plotly_chart(_sparkline_row(sparklines, colors), config={"displayModeBar": False},
+                            key=f"spark_{'_'.join(row_ids)}")
+
 
+@st.fragment
 def _render_fed_data_explorer():
-    """Render the Fed Data Explorer with selectable FRED series."""
-    st.subheader("Fed Data Explorer")
+    """Render the Fed Data Explorer with selectable FRED series.
 
-    # Build dropdown options from available FRED series
-    series_options = {f"{name} ({sid})": sid for sid, (name, _) in FRED_SERIES.items()}
+    Runs as a fragment, so changing the series, range or page reruns only
+    the explorer and not the regime, quadrant and chart sections above.
+    """
+    st.subheader("Fed Data Explorer")
 
+    # Series dropdown (options built once at import from FRED_SERIES)
     selected_label = st.selectbox(
         "Select Economic Series",
-        list(series_options.keys()),
+        _SERIES_OPTIONS_KEYS,
         key="fed_explorer_series",
     )
-    selected_id = series_options[selected_label]
+    selected_id = _SERIES_OPTIONS[selected_label]
 
     # Date range selector
-    range_options = {"1 Year": 252, "2 Years": 504, "5 Years": 1260, "10 Years": 2520, "All": 5000}
-    range_label = st.radio("Date Range", list(range_options.keys()), horizontal=True,
+    range_label = st.radio("Date Range", _RANGE_OPTIONS_KEYS, horizontal=True,
                            index=2, key="fed_explorer_range")
-    limit = range_options[range_label]
+    limit = _RANGE_OPTIONS[range_label]
 
     # Fetch data
-    data = _cached_macro_series(selected_id, limit)
+    version = _macro_dao().get_last_fetched([selected_id]).get(selected_id)
+    dates, values = _cached_macro_series(selected_id, limit, version)
 
-    if not data:
+    if not len(values):
         st.info(f"No data available for {selected_id}. Run data collection first.")
         return
 
-    dates = [d["date"] for d in reversed(data)]
-    values = [d["value"] for d in reversed(data)]
-
     # Full-width chart
     series_name = FRED_SERIES.get(selected_id, (selected_id, ""))[0]
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=dates, y=values,
-        name=series_name,
-        line=dict(color="#2962FF", width=2),
-        fill="tozeroy",
-        fillcolor="rgba(41, 98, 255, 0.08)",
-    ))
-    fig.update_layout(
-        title=series_name,
-        xaxis_title="Date",
-        yaxis_title="Value",
-        height=400,
-        template="plotly_dark",
-    )
-    st.plotly_chart(fig, width="stretch")
+    st.plotly_chart(_build_explorer_figure(dates, values, series_name), width="stretch")
 
     # Data table toggle
     if st.toggle("Show Raw Data", key="fed_explorer_table"):
-        import pandas as pd
-        df = pd.DataFrame({"Date": dates, "Value": values})
-        st.dataframe(df, hide_index=True, width="stretch")
+        import pyarrow as pa
+        n_pages = -(-len(values) // _RAW_PAGE_SIZE)
+        page = 1
+        if n_pages > 1:
+            page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages,
+                                   value=1, step=1, key="fed_explorer_page")
+        start = (page - 1) * _RAW_PAGE_SIZE
+        stop = start + _RAW_PAGE_SIZE
+        table = pa.table({"Date": pa.array(dates[start:stop]), "Value": pa.array(values[start:stop])})
+        st.dataframe(table, hide_index=True, width="stretch")
 
 
 def render():
     """Render the macro & market page."""
     st.header("Macro & Market Overview")
 
-    macro_dao = MacroDAO()
+    chart_series = _prefetch_chart_series()
 
     # === Fed Economic Indicators (TOP of page) ===
     st.subheader("Key Economic Indicators")
@@ -208,9 +436,8 @@ def render():
 
     # === Dalio Quadrant ===
     st.subheader("Dalio's Economic Machine")
-    # Use a stable key derived from regimes for caching
-    regimes_key = str(sorted(regimes.items())) if regimes else ""
-    dalio = _cached_dalio_quadrant(regimes_key)
+    regimes_key = _regimes_key(regimes)
+    dalio = _cached_dalio_quadrant(regimes_key, regimes)
 
     col1, col2 = st.columns([2, 1])
 
@@ -277,16 +504,6 @@ def render():
 
     st.divider()
 
-    # === Yield Curve Chart ===
-    st.subheader("Treasury Yield Curve")
-    _render_yield_curve_chart(macro_dao)
-
-    st.divider()
-
-    # === Credit Spread Chart ===
-    st.subheader("High Yield Credit Spread")
-    _render_series_chart(macro_dao, "BAMLH0A0HYM2", "ICE BofA HY Spread (%)", "red")
-
     # === Financial Stress ===
     col1, col2 = st.columns(2)
 
@@ -297,7 +514,6 @@ def render():
             color = "red" if fsi > 0 else "green"
             st.metric("St. Louis FSI", f"{fsi:.2f}",
                        delta="Above Normal" if fsi > 0 else "Normal")
-        _render_series_chart(macro_dao, "STLFSI4", "St. Louis Fed FSI", "orange")
 
     with col2:
         st.subheader("VIX (Fear Index)")
@@ -306,13 +522,16 @@ def render():
             color = "red" if vix > 25 else "green"
             st.metric("VIX", f"{vix:.1f}",
                        delta="Elevated" if vix > 25 else "Calm")
-        _render_series_chart(macro_dao, "VIXCLS", "CBOE VIX", "purple")
+
+    # === Yield Curve, Credit Spread & Stress Charts ===
+    st.subheader("Yield Curve & Market Stress")
+    _render_market_charts(chart_series)
 
     st.divider()
 
     # === Recession Probability ===
     st.subheader("Recession Probability")
-    recession_prob = _cached_recession_probability(regimes_key)
+    recession_prob = _cached_recession_probability(regimes_key, regimes)
     if recession_prob is not None:
         color = "red" if recession_prob > 40 else "orange" if recession_prob > 20 else "green"
         st.metric("Recession Probability", f"{recession_prob:.0f}%")
@@ -334,59 +553,13 @@ def render():
     macro_indicators_table(regimes)
 
 
-def _render_yield_curve_chart(macro_dao):
-    """Render yield curve chart using 2Y and 10Y treasury data."""
+def _render_market_charts(chart_series: dict[str, tuple[np.ndarray, np.ndarray]]):
+    """Render the yield curve, credit spread, FSI and VIX charts as one figure."""
     try:
-        dgs10 = _cached_macro_series("DGS10", 252)
-        dgs2 = _cached_macro_series("DGS2", 252)
-        spread = _cached_macro_series("T10Y2Y", 252)
-
-        if not spread:
-            st.info("No yield curve data available.")
+        series = tuple(chart_series[sid] for sid, _, _ in _MARKET_PANELS)
+        if not any(len(values) for _, values in series):
+            st.info("No yield curve or market stress data available.")
             return
-
-        dates = [s["date"] for s in reversed(spread)]
-        values = [s["value"] for s in reversed(spread)]
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=dates, y=values,
-            name="10Y-2Y Spread",
-            line=dict(color="cyan", width=2),
-            fill="tozeroy",
-            fillcolor="rgba(0,200,200,0.1)",
-        ))
-        fig.add_hline(y=0, line_dash="dash", line_color="red",
-                      annotation_text="Inversion Threshold")
-        fig.update_layout(
-            xaxis_title="Date", yaxis_title="Spread (%)",
-            height=300, template="plotly_dark",
-        )
-        st.plotly_chart(fig, width="stretch")
+        st.plotly_chart(_build_market_figure(series), width="stretch")
     except Exception as e:
-        st.warning(f"Yield curve chart failed: {e}")
-
-
-def _render_series_chart(macro_dao, series_id: str, title: str, color: str):
-    """Render a FRED series line chart."""
-    try:
-        data = _cached_macro_series(series_id, 120)
-        if not data:
-            return
-
-        dates = [d["date"] for d in reversed(data)]
-        values = [d["value"] for d in reversed(data)]
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=dates, y=values,
-            name=title,
-            line=dict(color=color, width=2),
-        ))
-        fig.update_layout(
-            height=200, template="plotly_dark",
-            margin=dict(l=0, r=0, t=30, b=0),
-        )
-        st.plotly_chart(fig, width="stretch")
-    except Exception:
-        pass
+        st.warning(f"Market charts failed: {e}")
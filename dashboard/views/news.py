@@ -1,10 +1,19 @@
 """News & Media Dashboard Page - Video, portfolio, market, and political news from credible sources."""
 
+import hashlib
+import re
 import time
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import streamlit as st
 import streamlit.components.v1 as components
+import numpy as np
 import pandas as pd
+import yfinance as yf
 from datetime import datetime, timedelta
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from database.connection import get_connection
 from database.models import StockDAO, NewsDAO, UserWatchlistDAO
@@ -42,8 +51,19 @@ SOURCE_CREDIBILITY = {
 }
 
 # Political/market news tickers (proxies for market-wide and political news)
-MARKET_TICKERS = ["SPY", "QQQ", "DIA", "IWM", "VTI"]
-POLITICAL_TICKERS = ["GLD", "TLT", "UUP", "DXY"]  # Gold, bonds, dollar - sensitive to political events
+MARKET_TICKERS = frozenset({"SPY", "QQQ", "DIA", "IWM", "VTI"})
+POLITICAL_TICKERS = frozenset({"GLD", "TLT", "UUP", "DXY"})  # Gold, bonds, dollar - sensitive to political events
+_POLITICAL_FEED_TICKERS = POLITICAL_TICKERS | {"SPY"}  # Political tab also reads SPY headlines
+
+# Keywords that mark an article as political/macro news
+POLITICAL_KEYWORDS = [
+    "fed", "federal reserve", "interest rate", "inflation", "gdp", "tariff",
+    "trade war", "sanctions", "election", "congress", "senate", "president",
+    "treasury", "debt ceiling", "fiscal", "monetary", "geopolit", "war",
+    "opec", "oil", "energy", "regulation", "antitrust", "tax",
+    "china", "europe", "ukraine", "russia", "middle east", "iran",
+]
+POLITICAL_KW_RE = re.compile("|".join(map(re.escape, POLITICAL_KEYWORDS)), re.IGNORECASE)
 
 # YouTube channel embed URLs (no API key needed)
 VIDEO_CHANNELS = {
@@ -55,32 +75,53 @@ VIDEO_CHANNELS = {
 }
 
 
+# Query params that only track referrals; dropped when canonicalizing article URLs
+_TRACKING_PARAMS = frozenset({".tsrc", "guccounter", "guce_referrer", "guce_referrer_sig", "ncid", "soc_src", "soc_trk"})
+
+# Lowercased lookups, built once: exact matches are a single hash lookup and
+# the fuzzy substring fallback no longer re-lowercases every name per call
+_CREDIBLE_SOURCES_LOWER = frozenset(cs.lower() for cs in CREDIBLE_SOURCES)
+_SOURCE_CREDIBILITY_LOWER = {name.lower(): score for name, score in SOURCE_CREDIBILITY.items()}
+# Longest name first, so fuzzy matches pick the most specific source
+_SOURCE_CREDIBILITY_BY_LENGTH = tuple(sorted(_SOURCE_CREDIBILITY_LOWER.items(), key=lambda kv: -len(kv[0])))
+
+
+@lru_cache(maxsize=None)
 def _is_credible(source: str) -> bool:
-    """Check if a source is in our credible whitelist (fuzzy match)."""
+    """Check if a source is in our credible whitelist (fuzzy match). Memoized; the whitelist is static."""
     if not source:
         return False
     source_lower = source.lower().strip()
-    for cs in CREDIBLE_SOURCES:
-        if cs.lower() in source_lower or source_lower in cs.lower():
-            return True
-    return False
+    if source_lower in _CREDIBLE_SOURCES_LOWER:
+        return True
+    return any(cs in source_lower or source_lower in cs for cs in _CREDIBLE_SOURCES_LOWER)
 
 
+@lru_cache(maxsize=None)
 def _get_credibility_score(source: str) -> float:
-    """Get the credibility weight for a source."""
+    """Get the credibility weight for a source. Memoized like _is_credible.
+
+    Exact names win; otherwise the longest name that fuzzy-matches.
+    """
     if not source:
         return 0.5
-    for name, score in SOURCE_CREDIBILITY.items():
-        if name.lower() in source.lower() or source.lower() in name.lower():
+    source_lower = source.lower()
+    score = _SOURCE_CREDIBILITY_LOWER.get(source_lower)
+    if score is not None:
+        return score
+    for name, score in _SOURCE_CREDIBILITY_BY_LENGTH:
+        if name in source_lower or source_lower in name:
             return score
     return 0.6  # Default for known but unscored sources
 
 
-@st.cache_data(ttl=1800, show_spinner=False)
+@st.cache_data(ttl=NEWS_STALE_MINUTES * 60, show_spinner=False)
 def _fetch_yfinance_news(ticker: str) -> list[dict]:
-    """Fetch latest news for a ticker from yfinance, filtering for credible sources. Cached 30min."""
+    """Fetch latest news for a ticker from yfinance, filtering for credible sources.
+
+    Cached for NEWS_STALE_MINUTES, the same window as the auto-refresh.
+    """
     try:
-        import yfinance as yf
         stock = yf.Ticker(ticker)
         news = stock.news
         if not news:
@@ -106,28 +147,97 @@ def _fetch_yfinance_news(ticker: str) -> list[dict]:
         return []
 
 
-def _store_articles(articles: list[dict]):
-    """Store fetched articles in the database."""
-    news_dao = NewsDAO()
-    for article in articles:
-        news_dao.insert(article)
+def _fetch_news_concurrently(tickers: list[str]):
+    """Yield (ticker, articles) as each ticker's yfinance news fetch completes.
+
+    Fetches run on a thread pool with the script context attached, so the
+    cached _fetch_yfinance_news behaves as if called from the script thread.
+    """
+    if not tickers:
+        return
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers)), initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())) as ex:
+        futures = {ex.submit(_fetch_yfinance_news, t): t for t in tickers}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
 
+def _canonical_url(url: str | None) -> str | None:
+    """Normalize an article URL: lowercase scheme/host, drop the fragment,
+    tracking query params and any trailing slash."""
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                       parts.path.rstrip("/") or "/", urlencode(query), ""))
 
-def _render_article_card(article: dict, show_credibility: bool = False):
-    """Render a single news article as a styled card."""
+
+def _url_key(url: str) -> bytes:
+    """Dedup key for a canonical URL (blake2b-128, like _title_key)."""
+    return hashlib.blake2b(url.encode(), digest_size=16).digest()
+
+
+def _store_articles(articles: list[dict]) -> int:
+    """Store fetched articles in the database in a single batch. Returns the number of new rows.
+
+    URLs are canonicalized first, so the same story fetched under several
+    tickers (or with different tracking params) is stored once; the
+    UNIQUE(url) constraint then catches it across batches.
+    """
+    seen = set()
+    unique = []
+    for a in articles:
+        url = _canonical_url(a.get("url"))
+        if url:
+            key = _url_key(url)
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append({**a, "url": url})
+    return NewsDAO().insert_many(unique)
+
+
+def _format_pub_dates(articles: list[dict]):
+    """Set article["pub_display"] on a batch of articles with one vectorized parse.
+
+    Timestamps are shown in UTC; anything unparseable falls back to its
+    first 16 characters.
+    """
+    if not articles:
+        return
+    raw = pd.Series([a.get("published_at") or a.get("fetched_at") or "" for a in articles], dtype=object)
+    parsed = pd.to_datetime(raw, utc=True, errors="coerce", format="ISO8601")
+    display = parsed.dt.strftime("%b %d, %Y %I:%M %p")
+    fallback = raw.map(lambda v: str(v)[:16])
+    for article, text in zip(articles, display.where(parsed.notna(), fallback)):
+        article["pub_display"] = text
+
+
+def _cards_html(articles: list[dict], show_credibility: bool = False) -> str:
+    """Join the cards for a list of articles into one HTML string ("" if empty)."""
+    if not articles:
+        return ""
+    _format_pub_dates(articles)
+    return "".join(_article_card_html(a, show_credibility) for a in articles)
+
+
+def _render_article_cards(articles: list[dict], show_credibility: bool = False):
+    """Render a list of articles as cards in a single st.markdown call."""
+    html = _cards_html(articles, show_credibility)
+    if html:
+        st.markdown(html, unsafe_allow_html=True)
+
+
+def _article_card_html(article: dict, show_credibility: bool = False) -> str:
+    """Build one news article card (dates preformatted by _format_pub_dates).
+
+    The markup is kept on a single line with no blank lines so that many
+    cards can be joined into one st.markdown HTML block.
+    """
     source = article.get("source", "Unknown")
-    pub = article.get("published_at") or article.get("fetched_at", "")
-    if pub:
-        try:
-            if isinstance(pub, str):
-                dt = datetime.fromisoformat(pub.replace("Z", "+00:00"))
-            else:
-                dt = pub
-            pub_display = dt.strftime("%b %d, %Y %I:%M %p")
-        except (ValueError, TypeError):
-            pub_display = str(pub)[:16]
-    else:
-        pub_display = ""
+    pub_display = article.get("pub_display", "")
 
     url = article.get("url", "")
     title = article.get("title", "No title")
@@ -143,71 +253,170 @@ def _render_article_card(article: dict, show_credibility: bool = False):
     else:
         cred_badge = ""
 
-    st.markdown(f"""
-    <div style="background: #1E222D;
-                border: 1px solid #2A2E39; border-radius: 10px;
-                padding: 16px; margin-bottom: 12px;">
-        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-            <span style="color: #787B86; font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px;">
-                {source}{cred_badge if show_credibility else ""}
-            </span>
-            <span style="color: #94a3b8; font-size: 0.75rem;">{pub_display}</span>
-        </div>
-        <div style="font-size: 1.05rem; font-weight: 600; color: #e2e8f0; margin-bottom: 6px;">
-            <a href="{url}" target="_blank" style="color: #e2e8f0; text-decoration: none;">
-                {title}
-            </a>
-        </div>
-        {"<div style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 8px;'>" + summary[:250] + ("..." if len(summary) > 250 else "") + "</div>" if summary else ""}
-        <div style="display: flex; gap: 8px; align-items: center;">
-            {"<span style='background: rgba(41, 98, 255, 0.3); color: #2962FF; padding: 2px 8px; border-radius: 4px; font-size: 0.75rem;'>" + ticker + "</span>" if ticker else ""}
-            {"<a href='" + url + "' target='_blank' style='color: #2962FF; font-size: 0.8rem; text-decoration: none;'>Read full article &rarr;</a>" if url else ""}
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-
-def _fetch_and_filter(tickers: list, credible_only: bool = True) -> list[dict]:
+    summary_html = (
+        "<div style='color: #94a3b8; font-size: 0.85rem; margin-bottom: 8px;'>"
+        + summary[:250] + ("..." if len(summary) > 250 else "") + "</div>"
+    ) if summary else ""
+    ticker_html = (
+        "<span style='background: rgba(41, 98, 255, 0.3); color: #2962FF; padding: 2px 8px; "
+        "border-radius: 4px; font-size: 0.75rem;'>" + ticker + "</span>"
+    ) if ticker else ""
+    link_html = (
+        "<a href='" + url + "' target='_blank' style='color: #2962FF; font-size: 0.8rem; "
+        "text-decoration: none;'>Read full article &rarr;</a>"
+    ) if url else ""
+
+    return (
+        '<div style="background: #1E222D; border: 1px solid #2A2E39; border-radius: 10px; '
+        'padding: 16px; margin-bottom: 12px;">'
+        '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">'
+        '<span style="color: #787B86; font-size: 0.75rem; text-transform: uppercase; letter-spacing: 1px;">'
+        f'{source}{cred_badge if show_credibility else ""}</span>'
+        f'<span style="color: #94a3b8; font-size: 0.75rem;">{pub_display}</span>'
+        '</div>'
+        '<div style="font-size: 1.05rem; font-weight: 600; color: #e2e8f0; margin-bottom: 6px;">'
+        f'<a href="{url}" target="_blank" style="color: #e2e8f0; text-decoration: none;">{title}</a>'
+        '</div>'
+        f'{summary_html}'
+        f'<div style="display: flex; gap: 8px; align-items: center;">{ticker_html}{link_html}</div>'
+        '</div>'
+    )
+
+
+def _fetch_and_filter(tickers: list | frozenset, credible_only: bool = True) -> list[dict]:
     """Fetch news for tickers and filter for credible sources."""
     all_articles = []
-    for ticker in tickers:
-        articles = _fetch_yfinance_news(ticker)
-        _store_articles(articles)
-        if credible_only:
-            articles = [a for a in articles if a.get("is_credible", True)]
+    for _, articles in _fetch_news_concurrently(tickers):
         all_articles.extend(articles)
+    if _store_articles(all_articles):
+        st.session_state.news_last_fetch = datetime.now()
+    if credible_only:
+        all_articles = [a for a in all_articles if a.get("is_credible", True)]
     return all_articles
 
 
+def _title_key(title: str) -> bytes:
+    """Dedup key for a headline: blake2b-128 of its NFKC-normalized, lowercased,
+    whitespace-collapsed form, so cosmetic variants of one story collide."""
+    normalized = " ".join(unicodedata.normalize("NFKC", title).lower().split())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+
 def _dedupe_and_sort(articles: list[dict]) -> list[dict]:
-    """Remove duplicate articles and sort by date."""
-    seen_titles = set()
-    unique = []
-    for a in articles:
-        title = a.get("title", "")
-        if title and title not in seen_titles:
-            seen_titles.add(title)
-            unique.append(a)
+    """Remove duplicate articles (by normalized title, first one wins) and sort newest first.
+
+    Dedup and the stable sort run in pandas over just the title key and
+    date columns; the original article dicts are returned untouched.
+    """
+    if not articles:
+        return []
 
     def sort_key(a):
         pub = a.get("published_at", "") or a.get("fetched_at", "") or ""
         return pub if isinstance(pub, str) else ""
-    unique.sort(key=sort_key, reverse=True)
-    return unique
+    df = pd.DataFrame({
+        "key": [_title_key(a["title"]) if a.get("title") else b"" for a in articles],
+        "pub": [sort_key(a) for a in articles],
+    })
+    df = df[df["key"] != b""].drop_duplicates("key")
+    df = df.sort_values("pub", ascending=False, kind="stable")
+    return [articles[i] for i in df.index]
 
 
-def _is_news_stale(db) -> bool:
-    """Check if the latest news article is older than NEWS_STALE_MINUTES."""
+def _stored_news_version(db) -> str:
+    """MAX(fetched_at) over stored news (an idx_news_fetched lookup), or "" if none.
+
+    Moves whenever any session, the scheduler or the CLI stores articles.
+    """
     latest = db.execute_one(
         "SELECT MAX(fetched_at) as last_fetch FROM news_articles"
     )
-    if not latest or not latest.get("last_fetch"):
-        return True
+    return (latest or {}).get("last_fetch") or ""
+
+
+def _last_news_fetch(db) -> datetime | None:
+    """Time of the last news refresh.
+
+    Read from session state when this session has already looked it up or
+    refreshed; otherwise from MAX(fetched_at), which is then remembered.
+    """
+    last_dt = st.session_state.get("news_last_fetch")
+    if last_dt is not None:
+        return last_dt
+    last_fetch = _stored_news_version(db)
+    if not last_fetch:
+        return None
     try:
-        last_dt = datetime.fromisoformat(latest["last_fetch"])
-        return datetime.now() - last_dt > timedelta(minutes=NEWS_STALE_MINUTES)
+        last_dt = datetime.fromisoformat(last_fetch)
     except (ValueError, TypeError):
+        return None
+    st.session_state.news_last_fetch = last_dt
+    return last_dt
+
+
+def _feed_html(articles: list[dict], credible_only: bool, show_badges: bool, limit: int = 30) -> str:
+    """Filter, dedupe and sort a tab's articles and build its card HTML."""
+    if credible_only:
+        articles = [a for a in articles if _is_credible(a.get("source", ""))]
+    return _cards_html(_dedupe_and_sort(articles)[:limit], show_badges)
+
+
+def _political_html(articles: list[dict], credible_only: bool, show_badges: bool) -> tuple[str, str]:
+    """Card HTML for the political tab, split into (keyword matches, other macro news)."""
+    if credible_only:
+        articles = [a for a in articles if _is_credible(a.get("source", ""))]
+    texts = pd.Series([f"{a.get('title') or ''} {a.get('summary') or ''}" for a in articles], dtype=object)
+    is_macro = texts.str.contains(POLITICAL_KW_RE).to_numpy(dtype=bool)
+    macro_articles = _dedupe_and_sort([articles[i] for i in np.flatnonzero(is_macro)])
+    other_articles = _dedupe_and_sort([articles[i] for i in np.flatnonzero(~is_macro)])
+    return _cards_html(macro_articles[:20], show_badges), _cards_html(other_articles[:10], show_badges)
+
+
+@st.cache_data(ttl=NEWS_STALE_MINUTES * 60, show_spinner=False)
+def _build_tab_html(news_version: str, portfolio_tickers: tuple[str, ...],
+                    credible_only: bool, show_badges: bool) -> dict:
+    """Card HTML for the portfolio, market and political tabs, built from the DB.
+
+    news_version (see _stored_news_version) is only part of the cache key,
+    so a rerun that just toggles a control is a single lookup, and articles
+    stored by anyone rebuild the tabs. A tab with no stored articles maps to
+    None, which tells render() to fetch it live.
+    """
+    stored = NewsDAO().get_latest_by_category({
+        "portfolio": (list(portfolio_tickers), 10),
+        "market": (MARKET_TICKERS, 15),
+        "political": (_POLITICAL_FEED_TICKERS, 10),
+    })
+    return {
+        "portfolio": _feed_html(stored["portfolio"], credible_only, show_badges) if stored["portfolio"] else None,
+        "market": _feed_html(stored["market"], credible_only, show_badges) if stored["market"] else None,
+        "political": _political_html(stored["political"], credible_only, show_badges) if stored["political"] else None,
+    }
+
+
+def _is_news_stale(db) -> bool:
+    """Check if the latest news refresh is older than NEWS_STALE_MINUTES."""
+    last_dt = _last_news_fetch(db)
+    if last_dt is None:
         return True
+    return datetime.now() - last_dt > timedelta(minutes=NEWS_STALE_MINUTES)
+
+
+@st.fragment(run_every=NEWS_STALE_MINUTES * 60)
+def _auto_refresh_news(tickers: list[str]):
+    """Refresh stale news after the page has painted from the DB.
+
+    Runs at the end of render() and then every NEWS_STALE_MINUTES on its
+    own; the whole page reruns only if new articles were stored.
+    """
+    if not _is_news_stale(get_connection()):
+        return
+    with st.spinner("Refreshing news in the background..."):
+        fresh = [a for _, articles in _fetch_news_concurrently(tickers[:30]) for a in articles]
+        inserted = _store_articles(fresh)
+    st.session_state.news_last_fetch = datetime.now()
+    if inserted:
+        st.rerun()
 
 
 def render():
@@ -232,21 +441,15 @@ def render():
         refresh = st.button("Refresh All News", type="primary")
 
     # News freshness indicator
-    latest_news = db.execute_one(
-        "SELECT MAX(fetched_at) as last_fetch FROM news_articles"
-    )
-    if latest_news and latest_news.get("last_fetch"):
-        try:
-            last_dt = datetime.fromisoformat(latest_news["last_fetch"])
-            mins_ago = int((datetime.now() - last_dt).total_seconds() / 60)
-            if mins_ago < 1:
-                freshness = "Just updated"
-            elif mins_ago < 60:
-                freshness = f"Updated {mins_ago}m ago"
-            else:
-                freshness = f"Updated at {last_dt.strftime('%I:%M %p')}"
-        except (ValueError, TypeError):
-            freshness = "Unknown"
+    last_dt = _last_news_fetch(db)
+    if last_dt is not None:
+        mins_ago = int((datetime.now() - last_dt).total_seconds() / 60)
+        if mins_ago < 1:
+            freshness = "Just updated"
+        elif mins_ago < 60:
+            freshness = f"Updated {mins_ago}m ago"
+        else:
+            freshness = f"Updated at {last_dt.strftime('%I:%M %p')}"
     else:
         freshness = "No news data yet"
     st.caption(f"{freshness}  |  Auto-refreshes when older than {NEWS_STALE_MINUTES}m")
@@ -265,11 +468,7 @@ def render():
     portfolio_tickers = [h["ticker"] for h in holdings]
 
     watchlist_tickers = wl_dao.get_tickers(user_id)
-
-    # Auto-fetch if stale (no button click needed)
-    stale = _is_news_stale(db)
-    if stale and not refresh:
-        refresh = True  # Trigger auto-refresh
+    all_tickers = list(frozenset(portfolio_tickers).union(watchlist_tickers, MARKET_TICKERS, POLITICAL_TICKERS))
 
     # === TABS ===
     tab_video, tab_portfolio, tab_market, tab_political, tab_all = st.tabs([
@@ -308,51 +507,38 @@ def render():
             with link_cols[i]:
                 st.markdown(f"[{name}]({url})")
 
-    # Fetch if refreshing (manual or auto)
+    # Manual refresh; stale news is refreshed by _auto_refresh_news after the page paints
     if refresh:
         with st.spinner("Fetching news from credible sources..."):
             progress = st.progress(0)
-            all_tickers = list(set(
-                portfolio_tickers + watchlist_tickers + MARKET_TICKERS + POLITICAL_TICKERS
-            ))
             total = len(all_tickers)
             all_fresh = []
-            for i, ticker in enumerate(all_tickers[:30]):  # Cap at 30
-                articles = _fetch_yfinance_news(ticker)
-                _store_articles(articles)
+            fetched = _fetch_news_concurrently(all_tickers[:30])  # Cap at 30
+            for i, (_, articles) in enumerate(fetched):
                 all_fresh.extend(articles)
                 progress.progress((i + 1) / min(total, 30))
+            _store_articles(all_fresh)
+            st.session_state.news_last_fetch = datetime.now()
             st.success(f"Fetched {len(all_fresh)} articles from {min(total, 30)} sources")
 
+    tab_html = _build_tab_html(_stored_news_version(db), tuple(portfolio_tickers), credible_only, show_badges)
+
     # === PORTFOLIO NEWS ===
     with tab_portfolio:
         st.subheader("Your Portfolio")
         if portfolio_tickers:
             st.caption(f"News for: {', '.join(portfolio_tickers[:10])}{'...' if len(portfolio_tickers) > 10 else ''}")
 
-            # Load from DB
-            portfolio_articles = []
-            for ticker in portfolio_tickers:
-                articles = list(db.execute(
-                    """SELECT * FROM news_articles
-                       WHERE ticker = ? ORDER BY published_at DESC LIMIT 10""",
-                    (ticker,),
-                ))
-                portfolio_articles.extend(articles)
-
-            # If empty, try fetching live
-            if not portfolio_articles:
-                with st.spinner("Loading portfolio news..."):
-                    portfolio_articles = _fetch_and_filter(portfolio_tickers[:10], credible_only)
+            html = tab_html["portfolio"]
 
-            if credible_only:
-                portfolio_articles = [a for a in portfolio_articles if _is_credible(a.get("source", ""))]
-
-            portfolio_articles = _dedupe_and_sort(portfolio_articles)
+            # If nothing is stored, try fetching live
+            if html is None:
+                with st.spinner("Loading portfolio news..."):
+                    html = _feed_html(_fetch_and_filter(portfolio_tickers[:10], credible_only),
+                                      credible_only, show_badges)
 
-            if portfolio_articles:
-                for article in portfolio_articles[:30]:
-                    _render_article_card(article, show_badges)
+            if html:
+                st.markdown(html, unsafe_allow_html=True)
             else:
                 st.info("No recent credible news for your holdings. Click 'Refresh All News' to fetch latest.")
         else:
@@ -363,27 +549,14 @@ def render():
         st.subheader("Market Headlines")
         st.caption("Broad market news from SPY, QQQ, DIA, and major indices")
 
-        market_articles = []
-        for ticker in MARKET_TICKERS:
-            articles = list(db.execute(
-                """SELECT * FROM news_articles
-                   WHERE ticker = ? ORDER BY published_at DESC LIMIT 15""",
-                (ticker,),
-            ))
-            market_articles.extend(articles)
+        html = tab_html["market"]
 
-        if not market_articles:
+        if html is None:
             with st.spinner("Fetching market headlines..."):
-                market_articles = _fetch_and_filter(MARKET_TICKERS, credible_only)
-
-        if credible_only:
-            market_articles = [a for a in market_articles if _is_credible(a.get("source", ""))]
-
-        market_articles = _dedupe_and_sort(market_articles)
+                html = _feed_html(_fetch_and_filter(MARKET_TICKERS, credible_only), credible_only, show_badges)
 
-        if market_articles:
-            for article in market_articles[:30]:
-                _render_article_card(article, show_badges)
+        if html:
+            st.markdown(html, unsafe_allow_html=True)
         else:
             st.info("No market news cached. Click 'Refresh All News' or add SPY/QQQ to your watchlist.")
 
@@ -392,52 +565,21 @@ def render():
         st.subheader("Political & Macro News")
         st.caption("News affecting gold, bonds, and the dollar - sensitive to geopolitical events")
 
-        political_articles = []
-        for ticker in POLITICAL_TICKERS + ["SPY"]:
-            articles = list(db.execute(
-                """SELECT * FROM news_articles
-                   WHERE ticker = ? ORDER BY published_at DESC LIMIT 10""",
-                (ticker,),
-            ))
-            political_articles.extend(articles)
+        sections = tab_html["political"]
 
-        if not political_articles:
+        if sections is None:
             with st.spinner("Fetching political & macro news..."):
-                political_articles = _fetch_and_filter(POLITICAL_TICKERS + ["SPY"], credible_only)
-
-        if credible_only:
-            political_articles = [a for a in political_articles if _is_credible(a.get("source", ""))]
-
-        # Filter for political/macro keywords
-        political_keywords = [
-            "fed", "federal reserve", "interest rate", "inflation", "gdp", "tariff",
-            "trade war", "sanctions", "election", "congress", "senate", "president",
-            "treasury", "debt ceiling", "fiscal", "monetary", "geopolit", "war",
-            "opec", "oil", "energy", "regulation", "antitrust", "tax",
-            "china", "europe", "ukraine", "russia", "middle east", "iran",
-        ]
+                sections = _political_html(_fetch_and_filter(_POLITICAL_FEED_TICKERS, credible_only),
+                                           credible_only, show_badges)
+        macro_html, other_html = sections
 
-        macro_articles = []
-        other_articles = []
-        for a in political_articles:
-            text = (a.get("title", "") + " " + a.get("summary", "")).lower()
-            if any(kw in text for kw in political_keywords):
-                macro_articles.append(a)
-            else:
-                other_articles.append(a)
-
-        macro_articles = _dedupe_and_sort(macro_articles)
-        other_articles = _dedupe_and_sort(other_articles)
-
-        if macro_articles:
+        if macro_html:
             st.markdown("**Political & Geopolitical**")
-            for article in macro_articles[:20]:
-                _render_article_card(article, show_badges)
-        if other_articles:
+            st.markdown(macro_html, unsafe_allow_html=True)
+        if other_html:
             st.markdown("**Other Macro News**")
-            for article in other_articles[:10]:
-                _render_article_card(article, show_badges)
-        if not macro_articles and not other_articles:
+            st.markdown(other_html, unsafe_allow_html=True)
+        if not macro_html and not other_html:
             st.info("No political/macro news cached. Click 'Refresh All News' to fetch.")
 
     # === ALL NEWS ===
@@ -462,8 +604,7 @@ def render():
 
             search_articles = _dedupe_and_sort(search_articles)
             if search_articles:
-                for article in search_articles[:30]:
-                    _render_article_card(article, show_badges)
+                _render_article_cards(search_articles[:30], show_badges)
             else:
                 st.info(f"No news found for {search_ticker}.")
         else:
@@ -480,8 +621,7 @@ def render():
 
             if all_cached:
                 st.caption(f"Showing {len(all_cached)} articles from credible sources")
-                for article in all_cached[:50]:
-                    _render_article_card(article, show_badges)
+                _render_article_cards(all_cached[:50], show_badges)
             else:
                 st.info("No news cached yet. Click 'Refresh All News' to get started.")
 
@@ -521,3 +661,5 @@ def render():
             for a in all_articles
         ])
         st.dataframe(summary_df, width="stretch", hide_index=True)
+
+    _auto_refresh_news(all_tickers)
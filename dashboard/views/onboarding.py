@@ -1,9 +1,13 @@
 """Onboarding Flow — Multi-step setup for new users."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
+import yfinance as yf
 
 from database.models import UserPreferencesDAO, UserWatchlistDAO, StockDAO, PortfolioDAO
 from dashboard.components.auth import get_current_user_id
+from utils.validators import validate_ticker
 
 
 POPULAR_STOCKS = [
@@ -14,6 +18,26 @@ POPULAR_STOCKS = [
 ]
 
 
+def _fetch_infos(tickers: list[str]) -> list[tuple[str, dict | Exception]]:
+    """Fetch yfinance .info for several tickers concurrently, in input order.
+
+    Each entry is (ticker, info) or (ticker, exception) so one bad symbol
+    doesn't sink the rest.
+    """
+    if not tickers:
+        return []
+    batch = yf.Tickers(" ".join(tickers))
+
+    def _info(t):
+        try:
+            return t, batch.tickers[t].info
+        except Exception as e:
+            return t, e
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as ex:
+        return list(ex.map(_info, tickers))
+
+
 def render():
     """Render the multi-step onboarding flow."""
     user_id = get_current_user_id()
@@ -191,19 +215,23 @@ def _step_watchlist(user_id: int, prefs_dao: UserPreferencesDAO):
     if st.button("Add Custom", key="ob_add_custom"):
         if custom:
             tickers = [t.strip().upper() for t in custom.split(",") if t.strip()]
-            for t in tickers:
+            rows = []
+            for t, info in _fetch_infos(tickers):
+                if isinstance(info, Exception):
+                    st.error(f"Failed: {t} — {info}")
+                    continue
                 try:
-                    import yfinance as yf
-                    info = yf.Ticker(t).info
-                    stock_dao.upsert(
-                        ticker=t,
-                        company_name=info.get("longName", info.get("shortName", "")),
-                        sector=info.get("sector", ""),
-                    )
-                    wl_dao.add(user_id, t)
-                    st.success(f"Added {t}")
+                    rows.append({
+                        "ticker": validate_ticker(t),
+                        "company_name": info.get("longName", info.get("shortName", "")),
+                        "sector": info.get("sector", ""),
+                    })
                 except Exception as e:
                     st.error(f"Failed: {t} — {e}")
+            if rows:
+                stock_dao.upsert_many(rows)
+                wl_dao.add_many(user_id, [r["ticker"] for r in rows])
+                st.success(f"Added {', '.join(r['ticker'] for r in rows)}")
 
     st.divider()
 
@@ -2,20 +2,26 @@
 
 import csv
 import io
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 
-from database.models import PortfolioDAO, StockDAO, RecurringInvestmentDAO
+from database.models import PortfolioDAO, StockDAO, RecurringInvestmentDAO, DecisionDAO, UserWatchlistDAO
 from database.connection import get_connection
 from dashboard.components.charts import create_sector_pie_chart, create_performance_chart
 from dashboard.components.tables import holdings_table, decisions_table
 from dashboard.components.teach_me import teach_if_enabled
+from utils.validators import validate_ticker
 
 # Cache TTL for live prices (seconds)
 PRICE_CACHE_TTL = 300  # Refresh prices every 5 minutes
 
+# Approximate purchases per month for each DCA frequency
+_MONTHLY_MULTIPLIER = {"daily": 21, "weekly": 4, "biweekly": 2, "monthly": 1}  # ~21 market days per month
+
 # Broker CSV column mappings: (ticker_col, shares_col, cost_col)
 # Values can be a list of possible column names (case-insensitive match)
 BROKER_FORMATS = {
@@ -63,28 +69,87 @@ BROKER_FORMATS = {
     },
 }
 
+# Currency symbols, thousands separators and whitespace stripped from numeric CSV cells
+_MONEY_RE = re.compile(r"[,$\s]")
+
+# Lowercased column names per broker, for matching against CSV headers
+_BROKER_COLUMNS_LOWER = {
+    broker: {key: [name.lower() for name in fmt[key]] for key in ("ticker", "shares", "cost")}
+    for broker, fmt in BROKER_FORMATS.items()
+}
+
+
+@st.cache_resource
+def _portfolio_dao() -> PortfolioDAO:
+    """Shared PortfolioDAO for all sessions (DAOs only wrap the singleton connection)."""
+    return PortfolioDAO()
+
+
+@st.cache_resource
+def _stock_dao() -> StockDAO:
+    """Shared StockDAO for all sessions."""
+    return StockDAO()
+
+
+@st.cache_resource
+def _recurring_dao() -> RecurringInvestmentDAO:
+    """Shared RecurringInvestmentDAO for all sessions."""
+    return RecurringInvestmentDAO()
+
+
+@st.cache_resource
+def _decision_dao() -> DecisionDAO:
+    """Shared DecisionDAO for all sessions."""
+    return DecisionDAO()
+
+
+@st.cache_resource
+def _watchlist_dao() -> UserWatchlistDAO:
+    """Shared UserWatchlistDAO for all sessions."""
+    return UserWatchlistDAO()
 
-def _get_live_prices(tickers: list[str]) -> dict:
-    """Fetch live prices for multiple tickers using yfinance batch download.
 
-    Uses session_state cache with TTL to avoid hammering the API on every rerun.
-    Returns {ticker: {price, change, change_pct}}.
+def _quotes_from_closes(close: pd.DataFrame) -> dict:
+    """Quotes from a Close-price frame (one column per ticker, one row per day).
+
+    Each ticker is priced off its own last two non-NaN closes, so a ticker
+    missing today's bar still reports yesterday's move; one close gives a
+    zero change and none leaves the ticker out.
     """
-    import math
+    arr = close.to_numpy(dtype=float, na_value=np.nan)
+    valid = ~np.isnan(arr)
+    seen = valid.cumsum(axis=0)
+    count = seen[-1] if len(arr) else np.zeros(arr.shape[1], dtype=int)
+    # Exactly one row per column matches each rank, so the sum picks it out
+    current = np.where(valid & (seen == count), arr, 0.0).sum(axis=0)
+    prev = np.where(valid & (seen == count - 1), arr, 0.0).sum(axis=0)
+    prev = np.where(count > 1, prev, current)
+    change = current - prev
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = np.where(prev != 0, change / prev * 100, 0.0)
+    return {
+        str(ticker): {"price": float(p), "change": float(c), "change_pct": float(pct)}
+        for ticker, p, c, pct, ok in zip(close.columns, current, change, change_pct, count > 0)
+        if ok
+    }
 
-    cache_key = "live_prices"
-    cache_ts_key = "live_prices_ts"
 
-    # Check if cache is still fresh
-    now = time.time()
-    if (cache_key in st.session_state
-            and cache_ts_key in st.session_state
-            and now - st.session_state[cache_ts_key] < PRICE_CACHE_TTL):
-        return st.session_state[cache_key]
+@st.cache_data(ttl=PRICE_CACHE_TTL, max_entries=256, show_spinner=False)
+def _cached_live_prices(tickers: tuple[str, ...]) -> tuple[dict, float]:
+    """Fetch live prices for multiple tickers using yfinance batch download.
+
+    Cached for PRICE_CACHE_TTL and shared by all sessions, so viewers of the
+    same ticker set share one download; max_entries bounds memory by the
+    number of distinct portfolios. Kept in memory only: Streamlit ignores the
+    TTL of disk-persisted caches, which would freeze prices. Returns
+    ({ticker: {price, change, change_pct}}, fetch time as a Unix timestamp).
+    """
+    import yfinance as yf
 
+    now = time.time()
     prices = {}
     if not tickers:
-        return prices
+        return prices, now
 
     try:
         # Batch download is much faster than individual yf.Ticker().info calls
@@ -92,32 +157,12 @@ def _get_live_prices(tickers: list[str]) -> dict:
         data = yf.download(ticker_str, period="5d", interval="1d", progress=False, threads=True)
 
         if data.empty:
-            return prices
-
-        for ticker in tickers:
-            try:
-                if len(tickers) == 1:
-                    close_series = data["Close"].dropna()
-                else:
-                    close_series = data["Close"][ticker].dropna()
+            return prices, now
 
-                if close_series is not None and len(close_series) > 0:
-                    current = float(close_series.iloc[-1])
-                    prev = float(close_series.iloc[-2]) if len(close_series) > 1 else current
-
-                    # Skip if NaN
-                    if math.isnan(current) or math.isnan(prev):
-                        continue
-
-                    change = current - prev
-                    change_pct = (change / prev * 100) if prev else 0
-                    prices[ticker] = {
-                        "price": current,
-                        "change": change,
-                        "change_pct": change_pct,
-                    }
-            except (KeyError, IndexError, TypeError, ValueError):
-                continue
+        close = data["Close"]
+        if isinstance(close, pd.Series):
+            close = close.to_frame(tickers[0])
+        prices = _quotes_from_closes(close)
 
         # For any tickers that failed batch, try individual fast info
         missing = [t for t in tickers if t not in prices]
@@ -126,9 +171,9 @@ def _get_live_prices(tickers: list[str]) -> dict:
                 info = yf.Ticker(ticker).fast_info
                 price = getattr(info, "last_price", None)
                 prev = getattr(info, "previous_close", None)
-                if price and not math.isnan(price):
-                    change = (price - prev) if prev and not math.isnan(prev) else 0
-                    change_pct = (change / prev * 100) if prev and not math.isnan(prev) else 0
+                if price and not np.isnan(price):
+                    change = (price - prev) if prev and not np.isnan(prev) else 0
+                    change_pct = (change / prev * 100) if prev and not np.isnan(prev) else 0
                     prices[ticker] = {
                         "price": price,
                         "change": change,
@@ -140,9 +185,12 @@ def _get_live_prices(tickers: list[str]) -> dict:
     except Exception:
         pass
 
-    # Update cache
-    st.session_state[cache_key] = prices
-    st.session_state[cache_ts_key] = now
+    return prices, now
+
+
+def _get_live_prices(tickers: list[str]) -> dict:
+    """Live prices for tickers as {ticker: {price, change, change_pct}} (see _cached_live_prices)."""
+    prices, _ = _cached_live_prices(tuple(sorted(set(tickers))))
     return prices
 
 
@@ -150,45 +198,131 @@ def _apply_live_prices(holdings: list[dict], live_prices: dict) -> list[dict]:
     """Update holdings with live price data, recalculating P&L.
 
     Only overwrites snapshot prices with live prices when valid (non-NaN).
+    P&L columns are computed for all holdings at once with NumPy and then
+    written back into copies of the holding dicts.
     """
-    import math
-
-    updated = []
-    for h in holdings:
-        h = dict(h)  # Make a mutable copy
-        ticker = h["ticker"]
-        if ticker in live_prices:
-            lp = live_prices[ticker]
-            new_price = lp["price"]
-
-            # Only apply if price is a valid number
-            if new_price and not math.isnan(new_price):
-                qty = h.get("quantity", 0) or 0
-                cost = h.get("average_cost", 0) or 0
-
-                h["current_price"] = new_price
-                h["market_value"] = qty * new_price
-                h["unrealized_pl"] = (new_price - cost) * qty if cost else 0
-                h["unrealized_pl_pct"] = ((new_price / cost) - 1) * 100 if cost else 0
-                h["_daily_change"] = lp.get("change", 0)
-                h["_daily_change_pct"] = lp.get("change_pct", 0)
-        updated.append(h)
+    if not holdings:
+        return []
+
+    quotes = [live_prices.get(h["ticker"]) or {} for h in holdings]
+    price = np.array([q.get("price") or np.nan for q in quotes], dtype=float)
+    qty = np.array([h.get("quantity", 0) or 0 for h in holdings], dtype=float)
+    cost = np.array([h.get("average_cost", 0) or 0 for h in holdings], dtype=float)
+
+    has_cost = cost != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        market_value = qty * price
+        unrealized_pl = np.where(has_cost, (price - cost) * qty, 0.0)
+        unrealized_pl_pct = np.where(has_cost, (price / cost - 1) * 100, 0.0)
+    valid = ~np.isnan(price)
+
+    updated = [dict(h) for h in holdings]  # Mutable copies
+    for i in np.flatnonzero(valid).tolist():
+        h = updated[i]
+        lp = quotes[i]
+        h["current_price"] = lp["price"]
+        h["market_value"] = float(market_value[i])
+        h["unrealized_pl"] = float(unrealized_pl[i])
+        h["unrealized_pl_pct"] = float(unrealized_pl_pct[i])
+        h["_daily_change"] = lp.get("change", 0)
+        h["_daily_change_pct"] = lp.get("change_pct", 0)
     return updated
 
 
+_NUMERIC_HOLDING_COLUMNS = ("quantity", "average_cost", "current_price", "market_value",
+                            "unrealized_pl", "unrealized_pl_pct", "_daily_change", "_daily_change_pct")
+
+
+def _holdings_frame(holdings: list[dict]) -> pd.DataFrame:
+    """Holdings as a DataFrame for vectorized totals and tables, one row per holding (same order).
+
+    Numeric columns are floats with None, NaN and non-numeric values as 0;
+    sector is a string column with missing values as "".
+    """
+    raw = pd.DataFrame(holdings)
+    df = pd.DataFrame({"ticker": raw["ticker"]})
+    for col in _NUMERIC_HOLDING_COLUMNS:
+        df[col] = pd.to_numeric(raw[col], errors="coerce").fillna(0.0).astype(float) if col in raw else 0.0
+    df["sector"] = raw["sector"].fillna("").astype(str) if "sector" in raw else ""
+    return df
+
+
 def _merge_and_snapshot(portfolio_dao, new_holding: dict, user_id: int = None):
     """Load existing holdings, merge in the new one, and create a fresh snapshot."""
+    _merge_and_snapshot_batch(portfolio_dao, [new_holding], user_id)
+
+
+def _merge_and_snapshot_batch(portfolio_dao, new_holdings: list[dict], user_id: int = None):
+    """Merge several new holdings into the existing ones and write a single snapshot.
+
+    Later entries win for a repeated ticker, as with one _merge_and_snapshot per row.
+    """
     existing = list(portfolio_dao.get_latest_holdings(user_id))
     merged = {h["ticker"]: dict(h) for h in existing}
-    merged[new_holding["ticker"]] = new_holding
+    for nh in new_holdings:
+        merged[nh["ticker"]] = nh
     portfolio_dao.snapshot_holdings(list(merged.values()), user_id)
 
 
-def _fetch_and_build_holding(ticker: str, shares: float, cost_basis: float) -> dict:
-    """Fetch live price data and build a holding dict."""
+def _save_imported_holdings(portfolio_dao, stock_dao, holdings: list[dict], user_id: int = None) -> int:
+    """Save fetched holdings (in order) with one snapshot and one stock upsert.
+
+    Holdings with an invalid ticker are skipped with a warning. Returns the
+    number saved.
+    """
+    valid, stock_rows = [], []
+    for holding in holdings:
+        info = holding.pop("_info")
+        try:
+            holding["ticker"] = validate_ticker(holding["ticker"])
+        except ValueError as e:
+            st.warning(f"Skipped {holding['ticker']}: {e}")
+            continue
+        valid.append(holding)
+        if not info:
+            continue  # Stock metadata already stored
+        stock_rows.append({
+            "ticker": holding["ticker"],
+            "company_name": info.get("longName", info.get("shortName", "")),
+            "sector": info.get("sector", ""),
+            "industry": info.get("industry", ""),
+            "market_cap": info.get("marketCap"),
+        })
+    if not valid:
+        return 0
+    try:
+        _merge_and_snapshot_batch(portfolio_dao, valid, user_id)
+        stock_dao.upsert_many(stock_rows)
+    except Exception as e:
+        st.error(f"Failed to save holdings: {e}")
+        return 0
+    return len(valid)
+
+
+def _fetch_and_build_holding(ticker: str, shares: float, cost_basis: float,
+                             known_sector: str | None = None) -> dict:
+    """Fetch live price data and build a holding dict.
+
+    The price comes from fast_info. The full .info payload is only fetched
+    when the stocks table has no sector for the ticker yet; otherwise
+    "_info" is empty and the stock row is left as it is.
+    """
+    import yfinance as yf
+
     stock = yf.Ticker(ticker)
-    info = stock.info
-    current_price = info.get("currentPrice") or info.get("regularMarketPrice") or cost_basis
+    fast = stock.fast_info
+    current_price = None
+    for key in ("last_price", "previous_close"):
+        try:
+            value = fast[key]
+        except Exception:
+            continue
+        if value and not np.isnan(value):
+            current_price = float(value)
+            break
+    info = {} if known_sector else stock.info
+    if current_price is None:
+        current_price = info.get("currentPrice") or info.get("regularMarketPrice") or cost_basis
     market_value = shares * current_price
     unrealized_pl = (current_price - cost_basis) * shares if cost_basis else 0
     unrealized_pl_pct = ((current_price / cost_basis) - 1) * 100 if cost_basis else 0
@@ -200,33 +334,59 @@ def _fetch_and_build_holding(ticker: str, shares: float, cost_basis: float) -> d
         "market_value": market_value,
         "unrealized_pl": unrealized_pl,
         "unrealized_pl_pct": unrealized_pl_pct,
-        "sector": info.get("sector", ""),
+        "sector": known_sector or info.get("sector", ""),
         "_info": info,  # pass along for stock upsert
     }
 
 
+def _fetch_holdings_concurrently(rows: list[dict], known_sectors: dict[str, str] | None = None):
+    """Yield (index, future) as each row's _fetch_and_build_holding call completes.
+
+    Each call is a blocking yfinance round-trip, so they run on a thread
+    pool; call future.result() to get the holding or its exception.
+    """
+    if not rows:
+        return
+    known_sectors = known_sectors or {}
+    with ThreadPoolExecutor(max_workers=min(16, len(rows))) as ex:
+        futures = {
+            ex.submit(_fetch_and_build_holding, r["ticker"], r["shares"], r["cost"],
+                      known_sectors.get(r["ticker"])): i
+            for i, r in enumerate(rows)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future
+
+
 def _find_column(header_row: list[str], possible_names: list[str]) -> int | None:
     """Find the index of a column by trying multiple possible names (case-insensitive)."""
-    header_lower = [h.lower().strip() for h in header_row]
+    header_index = {}
+    for i, h in enumerate(header_row):
+        header_index.setdefault(h.lower().strip(), i)  # First column wins on duplicates
     for name in possible_names:
-        if name.lower() in header_lower:
-            return header_lower.index(name.lower())
+        idx = header_index.get(name.lower())
+        if idx is not None:
+            return idx
     return None
 
 
+@st.cache_data(ttl=600, show_spinner=False)
 def _parse_broker_csv(csv_text: str, broker: str) -> list[dict]:
-    """Parse CSV text using broker-specific column mappings. Returns list of {ticker, shares, cost}."""
-    fmt = BROKER_FORMATS.get(broker)
+    """Parse CSV text using broker-specific column mappings. Returns list of {ticker, shares, cost}.
+
+    Cached for 10 minutes so re-clicking Import on the same pasted text skips the parse.
+    """
+    fmt = _BROKER_COLUMNS_LOWER.get(broker)
     if not fmt:
         return []
 
-    rows = list(csv.reader(io.StringIO(csv_text.strip())))
-    rows = [r for r in rows if any(cell.strip() for cell in r)]
-    if len(rows) < 2:
+    # Single pass over the reader: first non-blank row is the header, blank rows are skipped
+    reader = csv.reader(io.StringIO(csv_text.strip()))
+    header = next((r for r in reader if any(cell.strip() for cell in r)), None)
+    if header is None:
         return []
 
-    # First row is header
-    header = [h.strip() for h in rows[0]]
+    header = [h.strip() for h in header]
     ticker_idx = _find_column(header, fmt["ticker"])
     shares_idx = _find_column(header, fmt["shares"])
     cost_idx = _find_column(header, fmt["cost"])
@@ -235,7 +395,9 @@ def _parse_broker_csv(csv_text: str, broker: str) -> list[dict]:
         return []
 
     results = []
-    for parts in rows[1:]:
+    for parts in reader:
+        if not any(cell.strip() for cell in parts):
+            continue
         parts = [p.strip() for p in parts]
         if len(parts) <= max(filter(None, [ticker_idx, shares_idx, cost_idx]), default=0):
             continue
@@ -248,10 +410,10 @@ def _parse_broker_csv(csv_text: str, broker: str) -> list[dict]:
             if ":" in ticker:
                 ticker = ticker.split(":")[-1]
 
-            shares = abs(float(parts[shares_idx].replace(",", "").replace("$", "")))
+            shares = abs(float(_MONEY_RE.sub("", parts[shares_idx])))
             cost = 0.0
             if cost_idx is not None and cost_idx < len(parts):
-                cost_str = parts[cost_idx].replace(",", "").replace("$", "").strip()
+                cost_str = _MONEY_RE.sub("", parts[cost_idx])
                 if cost_str and cost_str not in ("--", "N/A", ""):
                     cost = abs(float(cost_str))
 
@@ -269,7 +431,7 @@ def _render_recurring_investments(holdings, user_id: int = None):
     teach_if_enabled("recurring_investment")
 
     db = get_connection()
-    recurring_dao = RecurringInvestmentDAO()
+    recurring_dao = _recurring_dao()
     active_plans = list(recurring_dao.get_all_active(user_id))
 
     # Show existing plans
@@ -289,15 +451,7 @@ def _render_recurring_investments(holdings, user_id: int = None):
         st.dataframe(pd.DataFrame(plan_data), width="stretch", hide_index=True)
 
         # Monthly DCA total
-        def _monthly_multiplier(freq):
-            if freq == "daily":
-                return 21  # ~21 market days per month
-            elif freq == "weekly":
-                return 4
-            elif freq == "biweekly":
-                return 2
-            return 1
-        monthly_total = sum(p["amount"] * _monthly_multiplier(p["frequency"]) for p in active_plans)
+        monthly_total = sum(p["amount"] * _MONTHLY_MULTIPLIER.get(p["frequency"], 1) for p in active_plans)
         st.metric("Estimated Monthly DCA", f"${monthly_total:,.2f}")
     else:
         st.info("No recurring investments set up yet. Add one below to start dollar-cost averaging.")
@@ -313,8 +467,7 @@ def _render_recurring_investments(holdings, user_id: int = None):
         ]
         _wl_tickers = []
         try:
-            from database.models import UserWatchlistDAO
-            _wl_tickers = UserWatchlistDAO().get_tickers(user_id)
+            _wl_tickers = _watchlist_dao().get_tickers(user_id)
         except Exception:
             pass
         _db_tickers = []
@@ -385,27 +538,50 @@ def _render_recurring_investments(holdings, user_id: int = None):
                         st.rerun()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_sector_figure(sector_pcts: tuple[tuple[str, float], ...]):
+    """Build the sector allocation pie (cached on the (sector, pct) pairs)."""
+    return create_sector_pie_chart(dict(sector_pcts))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_performance_figure(dates: tuple[str, ...], values: tuple[float, ...]):
+    """Build the portfolio performance line (cached on the snapshot series)."""
+    return create_performance_chart(list(dates), list(values))
+
+
+def _get_earnings_date(ticker: str) -> dict | None:
+    """Next earnings date for one ticker from yfinance, or None if unavailable."""
+    import yfinance as yf
+
+    try:
+        cal = yf.Ticker(ticker).calendar
+        if cal is not None:
+            if isinstance(cal, dict):
+                ed = cal.get("Earnings Date")
+                if ed:
+                    date_str = str(ed[0])[:10] if isinstance(ed, list) else str(ed)[:10]
+                    return {"Ticker": ticker, "Earnings Date": date_str}
+            elif isinstance(cal, pd.DataFrame) and not cal.empty:
+                if "Earnings Date" in cal.columns:
+                    date_str = str(cal["Earnings Date"].iloc[0])[:10]
+                    return {"Ticker": ticker, "Earnings Date": date_str}
+    except Exception:
+        pass
+    return None
+
+
 @st.cache_data(ttl=3600, show_spinner=False)
 def _fetch_earnings_calendar(tickers: tuple) -> list[dict]:
-    """Fetch upcoming earnings dates for tickers (cached 1 hour)."""
-    earnings_data = []
-    for t in tickers:
-        try:
-            stock_yf = yf.Ticker(t)
-            cal = stock_yf.calendar
-            if cal is not None:
-                if isinstance(cal, dict):
-                    ed = cal.get("Earnings Date")
-                    if ed:
-                        date_str = str(ed[0])[:10] if isinstance(ed, list) else str(ed)[:10]
-                        earnings_data.append({"Ticker": t, "Earnings Date": date_str})
-                elif isinstance(cal, pd.DataFrame) and not cal.empty:
-                    if "Earnings Date" in cal.columns:
-                        date_str = str(cal["Earnings Date"].iloc[0])[:10]
-                        earnings_data.append({"Ticker": t, "Earnings Date": date_str})
-        except Exception:
-            continue
-    return earnings_data
+    """Fetch upcoming earnings dates for tickers (cached 1 hour).
+
+    The per-ticker .calendar lookups are blocking network calls, so they
+    run on a thread pool; results keep the order of tickers.
+    """
+    if not tickers:
+        return []
+    with ThreadPoolExecutor(max_workers=min(10, len(tickers))) as ex:
+        return [e for e in ex.map(_get_earnings_date, tickers) if e]
 
 
 def render():
@@ -415,8 +591,8 @@ def render():
     from dashboard.components.auth import get_current_user_id
     user_id = get_current_user_id()
 
-    portfolio_dao = PortfolioDAO()
-    stock_dao = StockDAO()
+    portfolio_dao = _portfolio_dao()
+    stock_dao = _stock_dao()
     db = get_connection()
 
     # --- Add Holdings ---
@@ -433,8 +609,7 @@ def render():
         ]
         _wl_tickers = []
         try:
-            from database.models import UserWatchlistDAO
-            _wl_tickers = UserWatchlistDAO().get_tickers(user_id)
+            _wl_tickers = _watchlist_dao().get_tickers(user_id)
         except Exception:
             pass
         _db_tickers = []
@@ -495,16 +670,20 @@ def render():
                     with st.spinner(f"Adding {ticker_to_add}..."):
                         try:
                             cost = add_cost if add_cost > 0 else 0
-                            holding = _fetch_and_build_holding(ticker_to_add, add_shares, cost)
+                            holding = _fetch_and_build_holding(
+                                ticker_to_add, add_shares, cost,
+                                stock_dao.get_sectors([ticker_to_add]).get(ticker_to_add),
+                            )
                             info = holding.pop("_info")
                             _merge_and_snapshot(portfolio_dao, holding, user_id)
-                            stock_dao.upsert(
-                                ticker=ticker_to_add,
-                                company_name=info.get("longName", info.get("shortName", "")),
-                                sector=info.get("sector", ""),
-                                industry=info.get("industry", ""),
-                                market_cap=info.get("marketCap"),
-                            )
+                            if info:
+                                stock_dao.upsert(
+                                    ticker=ticker_to_add,
+                                    company_name=info.get("longName", info.get("shortName", "")),
+                                    sector=info.get("sector", ""),
+                                    industry=info.get("industry", ""),
+                                    market_cap=info.get("marketCap"),
+                                )
                             st.success(f"Added {add_shares:.2f} shares of {ticker_to_add}")
                             st.rerun()
                         except Exception as e:
@@ -528,23 +707,17 @@ def render():
                         st.error("Could not parse. Use format: `AAPL 100 @ 150`")
                     else:
                         progress = st.progress(0)
-                        imported = 0
-                        for i, row in enumerate(parsed):
+                        known_sectors = stock_dao.get_sectors([r["ticker"] for r in parsed])
+                        fetched = {}
+                        for done, (i, future) in enumerate(_fetch_holdings_concurrently(parsed, known_sectors), 1):
                             try:
-                                holding = _fetch_and_build_holding(row["ticker"], row["shares"], row["cost"])
-                                info = holding.pop("_info")
-                                _merge_and_snapshot(portfolio_dao, holding, user_id)
-                                stock_dao.upsert(
-                                    ticker=row["ticker"],
-                                    company_name=info.get("longName", info.get("shortName", "")),
-                                    sector=info.get("sector", ""),
-                                    industry=info.get("industry", ""),
-                                    market_cap=info.get("marketCap"),
-                                )
-                                imported += 1
+                                fetched[i] = future.result()
                             except Exception as e:
-                                st.warning(f"Skipped {row['ticker']}: {e}")
-                            progress.progress((i + 1) / len(parsed))
+                                st.warning(f"Skipped {parsed[i]['ticker']}: {e}")
+                            progress.progress(done / len(parsed))
+                        imported = _save_imported_holdings(
+                            portfolio_dao, stock_dao, [fetched[i] for i in sorted(fetched)], user_id,
+                        )
                         st.success(f"Added {imported} of {len(parsed)} holdings")
                         st.rerun()
 
@@ -576,22 +749,17 @@ def render():
                     else:
                         st.info(f"Found {len(parsed)} positions. Importing...")
                         progress = st.progress(0)
-                        imported = 0
-                        for i, row in enumerate(parsed):
+                        known_sectors = stock_dao.get_sectors([r["ticker"] for r in parsed])
+                        fetched = {}
+                        for done, (i, future) in enumerate(_fetch_holdings_concurrently(parsed, known_sectors), 1):
                             try:
-                                holding = _fetch_and_build_holding(row["ticker"], row["shares"], row["cost"])
-                                info = holding.pop("_info")
-                                _merge_and_snapshot(portfolio_dao, holding, user_id)
-                                stock_dao.upsert(
-                                    ticker=row["ticker"],
-                                    company_name=info.get("longName", ""),
-                                    sector=info.get("sector", ""),
-                                    industry=info.get("industry", ""),
-                                )
-                                imported += 1
+                                fetched[i] = future.result()
                             except Exception as e:
-                                st.warning(f"Skipped {row['ticker']}: {e}")
-                            progress.progress((i + 1) / len(parsed))
+                                st.warning(f"Skipped {parsed[i]['ticker']}: {e}")
+                            progress.progress(done / len(parsed))
+                        imported = _save_imported_holdings(
+                            portfolio_dao, stock_dao, [fetched[i] for i in sorted(fetched)], user_id,
+                        )
                         st.success(f"Imported {imported} of {len(parsed)} positions")
                         st.rerun()
                 else:
@@ -606,14 +774,13 @@ def render():
     # === LIVE PRICE REFRESH ===
     tickers = [h["ticker"] for h in holdings]
     with st.spinner("Refreshing live prices..."):
-        live_prices = _get_live_prices(tickers)
+        live_prices, price_ts = _cached_live_prices(tuple(sorted(set(tickers))))
     if live_prices:
         holdings = _apply_live_prices(holdings, live_prices)
 
     # Price freshness indicator
     from datetime import datetime
-    price_ts = st.session_state.get("live_prices_ts")
-    if price_ts:
+    if live_prices:
         refresh_time = datetime.fromtimestamp(price_ts)
         time_ago = int(time.time() - price_ts)
         if time_ago < 60:
@@ -627,23 +794,12 @@ def render():
 
     st.caption(f"{freshness}  |  Auto-refreshes every {PRICE_CACHE_TTL}s")
 
-    # Key metrics (filter out NaN values to prevent poisoning totals)
-    import math
-
-    def _safe_val(v):
-        """Return 0 for None, NaN, or non-numeric values."""
-        if v is None:
-            return 0
-        try:
-            f = float(v)
-            return 0 if math.isnan(f) else f
-        except (TypeError, ValueError):
-            return 0
-
-    total_value = sum(_safe_val(h["market_value"]) for h in holdings)
-    total_pl = sum(_safe_val(h["unrealized_pl"]) for h in holdings)
-    total_cost = sum(_safe_val(h.get("average_cost", 0)) * _safe_val(h.get("quantity", 0)) for h in holdings)
-    daily_change = sum(_safe_val(h.get("_daily_change", 0)) * _safe_val(h.get("quantity", 0)) for h in holdings)
+    # Key metrics (_holdings_frame zeroes NaN values to prevent poisoning totals)
+    hdf = _holdings_frame(holdings)
+    total_value = float(hdf["market_value"].sum())
+    total_pl = float(hdf["unrealized_pl"].sum())
+    total_cost = float((hdf["average_cost"] * hdf["quantity"]).sum())
+    daily_change = float((hdf["_daily_change"] * hdf["quantity"]).sum())
     num_positions = len(holdings)
 
     col1, col2, col3, col4 = st.columns(4)
@@ -653,8 +809,8 @@ def render():
                 delta=f"{(total_pl / max(total_cost, 1)) * 100:+.1f}%")
     col3.metric("Positions", str(num_positions))
 
-    sectors = set(h["sector"] for h in holdings if h.get("sector"))
-    col4.metric("Sectors", str(len(sectors)))
+    num_sectors = hdf.loc[hdf["sector"] != "", "sector"].nunique()
+    col4.metric("Sectors", str(num_sectors))
 
     teach_if_enabled("portfolio_value", inline=True)
     teach_if_enabled("unrealized_pl")
@@ -668,34 +824,21 @@ def render():
         st.subheader("Holdings vs Model Ratings")
 
         # Merge holdings with latest model recommendations
-        latest_decisions = {}
-        for t in tickers:
-            d = db.execute_one(
-                "SELECT action, composite_score FROM decisions WHERE ticker = ? ORDER BY decided_at DESC LIMIT 1",
-                (t,),
-            )
-            if d:
-                latest_decisions[t] = d
-
-        enriched = []
-        for h in holdings:
-            row = {
-                "Ticker": h["ticker"],
-                "Qty": f"{h['quantity']:.2f}",
-                "Price": f"${h['current_price']:.2f}" if h.get("current_price") else "N/A",
-                "Value": f"${_safe_val(h['market_value']):,.2f}",
-                "P&L %": f"{_safe_val(h.get('unrealized_pl_pct', 0)):+.1f}%",
-            }
-            dec = latest_decisions.get(h["ticker"])
-            if dec:
-                row["Rating"] = dec["action"]
-                row["Score"] = f"{dec['composite_score']:+.1f}"
-            else:
-                row["Rating"] = "N/A"
-                row["Score"] = "-"
-            enriched.append(row)
-
-        st.dataframe(pd.DataFrame(enriched), width="stretch", hide_index=True)
+        latest_decisions = {d["ticker"]: d for d in _decision_dao().get_latest_for_tickers(tickers)}
+
+        ratings = {t: d["action"] for t, d in latest_decisions.items()}
+        scores = {t: f"{d['composite_score']:+.1f}" for t, d in latest_decisions.items()}
+        enriched = pd.DataFrame({
+            "Ticker": hdf["ticker"],
+            "Qty": hdf["quantity"].map("{:.2f}".format),
+            "Price": hdf["current_price"].map("${:.2f}".format).where(hdf["current_price"] != 0, "N/A"),
+            "Value": hdf["market_value"].map("${:,.2f}".format),
+            "P&L %": hdf["unrealized_pl_pct"].map("{:+.1f}%".format),
+            "Rating": hdf["ticker"].map(ratings).fillna("N/A"),
+            "Score": hdf["ticker"].map(scores).fillna("-"),
+        })
+
+        st.dataframe(enriched, width="stretch", hide_index=True)
 
         # Delete holding controls
         tickers_in_portfolio = [h["ticker"] for h in holdings]
@@ -706,39 +849,33 @@ def render():
             st.rerun()
 
     with right:
-        sector_weights = {}
-        for h in holdings:
-            sector = h.get("sector") or "Unknown"
-            sector_weights[sector] = sector_weights.get(sector, 0) + _safe_val(h["market_value"])
-
-        if sector_weights and total_value > 0:
-            sector_pcts = {k: v / total_value * 100 for k, v in sector_weights.items()}
-            fig = create_sector_pie_chart(sector_pcts)
+        sector_weights = hdf["market_value"].groupby(hdf["sector"].replace("", "Unknown"), sort=False).sum()
+
+        if not sector_weights.empty and total_value > 0:
+            sector_pcts = sector_weights / total_value * 100
+            fig = _build_sector_figure(tuple(zip(sector_pcts.index, sector_pcts.tolist())))
             st.plotly_chart(fig, width="stretch")
             teach_if_enabled("sector_allocation")
 
     st.divider()
 
     # === TAX-LOSS HARVESTING ALERTS ===
-    harvest_candidates = [
-        h for h in holdings
-        if _safe_val(h.get("unrealized_pl_pct", 0)) < -5
-    ]
-    if harvest_candidates:
-        with st.expander(f"Tax-Loss Harvesting Candidates ({len(harvest_candidates)})"):
+    harvest = hdf[hdf["unrealized_pl_pct"] < -5]
+    if not harvest.empty:
+        with st.expander(f"Tax-Loss Harvesting Candidates ({len(harvest)})"):
             st.caption("Holdings with >5% unrealized loss that may qualify for tax-loss harvesting.")
-            harvest_data = [{
-                "Ticker": h["ticker"],
-                "Loss": f"${_safe_val(h['unrealized_pl']):+,.2f}",
-                "Loss %": f"{_safe_val(h.get('unrealized_pl_pct', 0)):+.1f}%",
-                "Cost Basis": f"${_safe_val(h.get('average_cost', 0)):,.2f}",
-                "Current": f"${_safe_val(h.get('current_price', 0)):,.2f}",
-            } for h in harvest_candidates]
-            st.dataframe(pd.DataFrame(harvest_data), width="stretch", hide_index=True)
+            harvest_data = pd.DataFrame({
+                "Ticker": harvest["ticker"],
+                "Loss": harvest["unrealized_pl"].map("${:+,.2f}".format),
+                "Loss %": harvest["unrealized_pl_pct"].map("{:+.1f}%".format),
+                "Cost Basis": harvest["average_cost"].map("${:,.2f}".format),
+                "Current": harvest["current_price"].map("${:,.2f}".format),
+            })
+            st.dataframe(harvest_data, width="stretch", hide_index=True)
 
     # === EARNINGS CALENDAR ===
     with st.expander("Upcoming Earnings"):
-        earnings_data = _fetch_earnings_calendar(tuple(tickers[:20]))
+        earnings_data = _fetch_earnings_calendar(tuple(sorted(tickers[:20])))
         if earnings_data:
             st.dataframe(pd.DataFrame(earnings_data), width="stretch", hide_index=True)
         else:
@@ -757,17 +894,22 @@ def render():
 
     # Performance chart
     st.subheader("Portfolio Performance")
-    snapshots = list(db.execute(
-        """SELECT snapshot_date, total_equity FROM portfolio_snapshots
-           WHERE total_equity IS NOT NULL AND (user_id = ? OR user_id IS NULL)
-           ORDER BY snapshot_date ASC LIMIT 365""",
-        (user_id,),
-    ))
+    snapshots = pd.DataFrame(
+        db.execute(
+            """SELECT substr(snapshot_date, 1, 10) AS day, total_equity
+               FROM portfolio_snapshots
+               WHERE total_equity IS NOT NULL AND (user_id = ? OR user_id IS NULL)
+               ORDER BY snapshot_date ASC LIMIT 365""",
+            (user_id,),
+        ),
+        columns=["day", "total_equity"],
+    )
 
     if len(snapshots) >= 2:
-        dates = [s["snapshot_date"][:10] for s in snapshots]
-        values = [s["total_equity"] for s in snapshots]
-        fig = create_performance_chart(dates, values)
+        fig = _build_performance_figure(
+            tuple(snapshots["day"].tolist()),
+            tuple(snapshots["total_equity"].astype(float).tolist()),
+        )
         st.plotly_chart(fig, width="stretch")
     else:
         st.info("Insufficient snapshot data for performance chart. Data accumulates over time.")
@@ -5,58 +5,141 @@ Scans the full market, not just the watchlist. Uses curated stock universes
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
 import streamlit as st
 import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from database.connection import get_connection
 from database.models import StockDAO, UserWatchlistDAO
 from dashboard.components.auth import get_current_user_id
 from dashboard.components.teach_me import teach_if_enabled, teach_me
+from utils.validators import validate_ticker
 
 # Curated stock universes for market-wide scanning
-STOCK_UNIVERSES = {
-    "S&P 500 - Top 50": [
+STOCK_UNIVERSES: dict[str, tuple[str, ...]] = {
+    "S&P 500 - Top 50": (
         "AAPL", "MSFT", "AMZN", "NVDA", "GOOGL", "META", "BRK-B", "TSLA", "UNH", "JNJ",
         "XOM", "JPM", "V", "PG", "MA", "HD", "CVX", "ABBV", "MRK", "LLY",
         "AVGO", "PEP", "KO", "COST", "TMO", "MCD", "WMT", "CSCO", "ACN", "ABT",
         "CRM", "DHR", "NKE", "TXN", "LIN", "NEE", "PM", "UNP", "ORCL", "AMD",
         "INTC", "RTX", "LOW", "AMGN", "UPS", "CAT", "BA", "GS", "SPGI", "BLK",
-    ],
-    "Growth & Tech": [
+    ),
+    "Growth & Tech": (
         "NVDA", "TSLA", "AMD", "PLTR", "SOFI", "SNOW", "CRWD", "NET", "DDOG", "ZS",
         "SHOP", "SQ", "COIN", "MELI", "SE", "GRAB", "NU", "RBLX", "U", "TTD",
         "ENPH", "SEDG", "FSLR", "PLUG", "ARM", "SMCI", "MRVL", "ON", "ANET", "PANW",
-    ],
-    "Dividend Aristocrats": [
+    ),
+    "Dividend Aristocrats": (
         "JNJ", "PG", "KO", "PEP", "MMM", "ABT", "ABBV", "MCD", "WMT", "T",
         "XOM", "CVX", "CL", "ED", "GPC", "SWK", "EMR", "ITW", "ADP", "BDX",
         "WBA", "LOW", "SHW", "CINF", "TGT", "AFL", "APD", "MKC", "CTAS", "ROP",
-    ],
-    "ETFs & Market Indices": [
+    ),
+    "ETFs & Market Indices": (
         "SPY", "QQQ", "DIA", "IWM", "VTI", "VOO", "ARKK", "XLF", "XLK", "XLE",
         "XLV", "XLI", "XLP", "XLU", "XLB", "XLRE", "GLD", "SLV", "TLT", "HYG",
-    ],
-    "Value Picks": [
+    ),
+    "Value Picks": (
         "BRK-B", "JPM", "BAC", "WFC", "C", "GM", "F", "VZ", "T", "INTC",
         "BMY", "GILD", "MO", "PM", "KHC", "WBA", "DVN", "HAL", "CF", "OXY",
         "DAL", "UAL", "LUV", "MGM", "WYNN", "HBI", "NUE", "CLF", "AA", "X",
-    ],
-    "Small Cap Movers": [
+    ),
+    "Small Cap Movers": (
         "IONQ", "RGTI", "QUBT", "QBTS", "SOUN", "BBAI", "BFLY", "JOBY", "LILM", "ACHR",
         "DNA", "NKLA", "GOEV", "LAZR", "VLDR", "OUST", "ASTS", "MNTS", "ASTR", "SPCE",
         "OPEN", "WISH", "CLOV", "SOFI", "HOOD", "UPST", "AFRM", "BILL", "LMND", "ROOT",
-    ],
+    ),
 }
 
 
+@st.cache_resource
+def _stock_dao() -> StockDAO:
+    """Shared StockDAO for all sessions (DAOs only wrap the singleton connection)."""
+    return StockDAO()
+
+
+@st.cache_resource
+def _watchlist_dao() -> UserWatchlistDAO:
+    """Shared UserWatchlistDAO for all sessions."""
+    return UserWatchlistDAO()
+
+
+@st.cache_resource
+def _decision_engine():
+    """Shared DecisionEngine for all sessions, imported and built on the first scan."""
+    from engine.decision_engine import DecisionEngine
+    return DecisionEngine()
+
+
+@st.cache_resource
+def _yahoo_collector():
+    """Shared YahooFinanceCollector, so its rate limiter spans all sessions."""
+    from collectors.yahoo_finance import YahooFinanceCollector
+    return YahooFinanceCollector()
+
+
+# decisions columns (aliased d) read by the overview table and recommendation
+# cards; skips reasoning_json, target_price and the outcome columns
+_DECISION_COLUMNS = ", ".join(f"d.{c}" for c in (
+    "ticker", "action", "composite_score", "confidence", "position_size_pct", "stop_loss_pct",
+    "time_horizon", "bull_case", "bear_case", "risk_warnings", "analysis_breakdown_json",
+    "extended_data_json", "decided_at",
+))
+
+# Summary bucket (and detail tab) for each decision action
+_ACTION_BUCKET = {
+    "STRONG_BUY": "BUY", "BUY": "BUY",
+    "HOLD": "HOLD",
+    "SELL": "SELL", "STRONG_SELL": "SELL",
+}
+
+
+def _parse_extended(decision: dict) -> dict:
+    """Decode a decision's extended_data_json, or {} if missing or malformed."""
+    blob = decision.get("extended_data_json")
+    if not blob:
+        return {}
+    try:
+        return json.loads(blob)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+
+
+_ACTION_COLORS = {
+    "STRONG_BUY": "#10b981", "BUY": "#10b981",
+    "STRONG_SELL": "#ef4444", "SELL": "#ef4444",
+}
+
+# Recommendation card header, built once at import instead of per card
+_CARD_HEADER_TMPL = """
+<div style="background: linear-gradient(135deg, rgba(45, 27, 105, 0.4), rgba(30, 20, 70, 0.6));
+            border: 1px solid {color}40; border-radius: 12px;
+            padding: 20px; margin-bottom: 16px;
+            border-left: 4px solid {color};">
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px;">
+        <div>
+            <span style="font-size: 1.5rem; font-weight: 800; color: #f59e0b;">{ticker}</span>
+            {company_html}
+            <span style="color: {color}; font-weight: 700; font-size: 1.1rem; margin-left: 12px;
+                         background: {color}20; padding: 4px 12px; border-radius: 6px;">
+                {action}
+            </span>
+        </div>
+        <div style="text-align: right;">
+            <div style="color: #94a3b8; font-size: 0.75rem; text-transform: uppercase;">Score</div>
+            <div style="color: {color}; font-size: 1.3rem; font-weight: 700;">{score:+.1f}</div>
+        </div>
+    </div>
+</div>
+"""
+_CARD_COMPANY_TMPL = "<span style='color: #94a3b8; font-size: 0.9rem; margin-left: 8px;'>{company}</span>"
+
+
 def _action_color(action: str) -> str:
     """Return the theme color for an action."""
-    a = action.upper()
-    if a in ("STRONG_BUY", "BUY"):
-        return "#10b981"
-    elif a in ("STRONG_SELL", "SELL"):
-        return "#ef4444"
-    return "#f59e0b"
+    return _ACTION_COLORS.get(action.upper(), "#f59e0b")
 
 
 def _render_recommendation_card(decision: dict, extended: dict):
@@ -77,27 +160,13 @@ def _render_recommendation_card(decision: dict, extended: dict):
     color = _action_color(action)
 
     # Card header
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, rgba(45, 27, 105, 0.4), rgba(30, 20, 70, 0.6));
-                border: 1px solid {color}40; border-radius: 12px;
-                padding: 20px; margin-bottom: 16px;
-                border-left: 4px solid {color};">
-        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px;">
-            <div>
-                <span style="font-size: 1.5rem; font-weight: 800; color: #f59e0b;">{ticker}</span>
-                {"<span style='color: #94a3b8; font-size: 0.9rem; margin-left: 8px;'>" + company[:30] + "</span>" if company else ""}
-                <span style="color: {color}; font-weight: 700; font-size: 1.1rem; margin-left: 12px;
-                             background: {color}20; padding: 4px 12px; border-radius: 6px;">
-                    {action.replace("_", " ")}
-                </span>
-            </div>
-            <div style="text-align: right;">
-                <div style="color: #94a3b8; font-size: 0.75rem; text-transform: uppercase;">Score</div>
-                <div style="color: {color}; font-size: 1.3rem; font-weight: 700;">{score:+.1f}</div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_CARD_HEADER_TMPL.format(
+        color=color,
+        ticker=ticker,
+        company_html=_CARD_COMPANY_TMPL.format(company=company[:30]) if company else "",
+        action=action.replace("_", " "),
+        score=score,
+    ), unsafe_allow_html=True)
 
     # Metrics row
     m1, m2, m3, m4, m5 = st.columns(5)
@@ -178,14 +247,104 @@ def _render_recommendation_card(decision: dict, extended: dict):
     st.divider()
 
 
+# yfinance info fields read by the quick screen and the stocks upsert
+_SCREEN_INFO_FIELDS = (
+    "currentPrice", "regularMarketPrice", "regularMarketChangePercent", "marketCap",
+    "trailingPE", "targetMeanPrice", "recommendationKey", "longName", "shortName",
+    "sector", "industry",
+)
+
+
+@st.cache_data(ttl=300, max_entries=512, show_spinner=False)
+def _fetch_ticker_info(ticker: str) -> dict:
+    """yfinance info for one ticker, trimmed to _SCREEN_INFO_FIELDS.
+
+    Cached for 5 minutes across sessions so repeat screens of a universe skip
+    the network; only the fields the screen reads are kept.
+    """
+    import yfinance as yf
+
+    info = yf.Ticker(ticker).info
+    return {k: info[k] for k in _SCREEN_INFO_FIELDS if k in info}
+
+
+def _fetch_screen_row(ticker: str, quote: dict | None = None) -> tuple[dict, dict]:
+    """Fetch yfinance info for one ticker for the quick screen.
+
+    quote is the ticker's entry from the batched live-price download; when
+    given, its price and daily change are used instead of the info fields.
+    Returns (table row, StockDAO.upsert kwargs). Runs on a worker thread, so
+    it only does network I/O; the caller writes to the database.
+    """
+    info = _fetch_ticker_info(ticker)
+    if quote:
+        price, change = quote["price"], quote["change_pct"]
+    else:
+        price = info.get("currentPrice") or info.get("regularMarketPrice", 0)
+        change = info.get("regularMarketChangePercent", 0)
+    mc = info.get("marketCap", 0)
+    pe = info.get("trailingPE")
+    target = info.get("targetMeanPrice")
+    upside = ((target / price) - 1) * 100 if target and price else None
+    rec = info.get("recommendationKey", "N/A")
+
+    row = {
+        "Ticker": ticker,
+        "Company": (info.get("longName") or info.get("shortName", ""))[:25],
+        "Price": f"${price:,.2f}" if price else "N/A",
+        "Change %": f"{change:+.2f}%" if change else "N/A",
+        "Market Cap": f"${mc / 1e9:,.1f}B" if mc > 1e9 else f"${mc / 1e6:,.0f}M" if mc else "N/A",
+        "P/E": f"{pe:.1f}" if pe else "N/A",
+        "Analyst Target": f"${target:,.2f}" if target else "N/A",
+        "Upside": f"{upside:+.1f}%" if upside else "N/A",
+        "Analyst View": rec.replace("_", " ").title() if rec else "N/A",
+        "Sector": info.get("sector", "N/A"),
+    }
+    stock_kwargs = {
+        "ticker": ticker,
+        "company_name": info.get("longName", info.get("shortName", "")),
+        "sector": info.get("sector", ""),
+        "industry": info.get("industry", ""),
+        "market_cap": mc,
+    }
+    return row, stock_kwargs
+
+
+def _overview_frame(decisions: list[dict]) -> pd.DataFrame:
+    """Formatted Recommendations Overview table, one row per decision (same order).
+
+    Expects each decision's parsed extended data under "_ext".
+    """
+    raw = pd.DataFrame(decisions)
+
+    def _text(col: str, width: int) -> pd.Series:
+        return raw[col].fillna("").astype(str).str.slice(0, width)
+
+    def _optional(col: str, fmt: str, missing: str) -> np.ndarray:
+        values = pd.to_numeric(raw[col], errors="coerce").fillna(0.0)
+        return np.where(values != 0, values.map(fmt.format), missing)
+
+    raw["upside"] = [(d["_ext"].get("price_targets") or {}).get("upside_pct") for d in decisions]
+    return pd.DataFrame({
+        "Ticker": raw["ticker"],
+        "Company": _text("company_name", 25),
+        "Sector": _text("sector", 15),
+        "Action": raw["action"].str.replace("_", " "),
+        "Score": raw["composite_score"].astype(float).map("{:+.1f}".format),
+        "Confidence": _optional("confidence", "{:.0%}", "N/A"),
+        "Position": _optional("position_size_pct", "{:.1f}%", "-"),
+        "Upside": _optional("upside", "{:+.1f}%", "-"),
+        "Date": _text("decided_at", 10),
+    })
+
+
 def render():
     """Render the stock recommendations page."""
     st.header("Stock Recommendations")
 
-    db = get_connection()
-    stock_dao = StockDAO()
+    stock_dao = _stock_dao()
     user_id = get_current_user_id()
-    wl_dao = UserWatchlistDAO()
+    wl_dao = _watchlist_dao()
 
     # Teach Me section at the top
     teach_if_enabled("buy_recommendation")
@@ -230,49 +389,40 @@ def render():
     elif scan_source == "Previously Analyzed":
         tickers_to_scan = []  # Will pull from DB
     else:
-        tickers_to_scan = STOCK_UNIVERSES.get(scan_source, [])[:max_stocks]
+        tickers_to_scan = STOCK_UNIVERSES.get(scan_source, ())[:max_stocks]
 
     # Quick screen - just fetch basic info without full analysis
     if quick_screen and tickers_to_scan:
         with st.spinner(f"Screening {len(tickers_to_scan)} stocks..."):
-            import yfinance as yf
-            screen_data = []
+            from dashboard.views.portfolio import _get_live_prices
+
+            # One batched download for prices; info lookups below fill in the fundamentals
+            quotes = _get_live_prices(tickers_to_scan)
+            screen_data, stock_rows = {}, []
             progress = st.progress(0)
-            for i, ticker in enumerate(tickers_to_scan):
-                try:
-                    stock = yf.Ticker(ticker)
-                    info = stock.info
-                    price = info.get("currentPrice") or info.get("regularMarketPrice", 0)
-                    change = info.get("regularMarketChangePercent", 0)
-                    mc = info.get("marketCap", 0)
-                    pe = info.get("trailingPE")
-                    target = info.get("targetMeanPrice")
-                    upside = ((target / price) - 1) * 100 if target and price else None
-                    rec = info.get("recommendationKey", "N/A")
-
-                    screen_data.append({
-                        "Ticker": ticker,
-                        "Company": (info.get("longName") or info.get("shortName", ""))[:25],
-                        "Price": f"${price:,.2f}" if price else "N/A",
-                        "Change %": f"{change:+.2f}%" if change else "N/A",
-                        "Market Cap": f"${mc / 1e9:,.1f}B" if mc > 1e9 else f"${mc / 1e6:,.0f}M" if mc else "N/A",
-                        "P/E": f"{pe:.1f}" if pe else "N/A",
-                        "Analyst Target": f"${target:,.2f}" if target else "N/A",
-                        "Upside": f"{upside:+.1f}%" if upside else "N/A",
-                        "Analyst View": rec.replace("_", " ").title() if rec else "N/A",
-                        "Sector": info.get("sector", "N/A"),
-                    })
-                    # Upsert into stocks table for future use
-                    stock_dao.upsert(
-                        ticker=ticker,
-                        company_name=info.get("longName", info.get("shortName", "")),
-                        sector=info.get("sector", ""),
-                        industry=info.get("industry", ""),
-                        market_cap=mc,
-                    )
-                except Exception:
-                    pass
-                progress.progress((i + 1) / len(tickers_to_scan))
+            with ThreadPoolExecutor(max_workers=min(16, len(tickers_to_scan)), initializer=add_script_run_ctx,
+                                    initargs=(None, get_script_run_ctx())) as ex:
+                futures = {
+                    ex.submit(_fetch_screen_row, t, quotes.get(t)): i for i, t in enumerate(tickers_to_scan)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    progress.progress(done / len(tickers_to_scan))
+                    try:
+                        row, stock_kwargs = future.result()
+                    except Exception:
+                        continue
+                    screen_data[futures[future]] = row
+                    try:
+                        stock_kwargs["ticker"] = validate_ticker(stock_kwargs["ticker"])
+                    except ValueError:
+                        continue  # Shown in the table, but not a storable ticker (e.g. BRK-B)
+                    stock_rows.append(stock_kwargs)
+            screen_data = [screen_data[i] for i in sorted(screen_data)]
+            # Upsert into stocks table for future use, in one transaction
+            try:
+                stock_dao.upsert_many(stock_rows)
+            except Exception:
+                pass
 
             if screen_data:
                 st.dataframe(pd.DataFrame(screen_data), width="stretch", hide_index=True)
@@ -283,27 +433,38 @@ def render():
     if run_scan and tickers_to_scan:
         with st.spinner(f"Collecting data & analyzing {len(tickers_to_scan)} stocks (this may take a few minutes)..."):
             progress = st.progress(0)
-            from engine.decision_engine import DecisionEngine
-            from collectors.yahoo_finance import YahooFinanceCollector
-
-            engine = DecisionEngine()
-            yfc = YahooFinanceCollector()
+            engine = _decision_engine()
+            yfc = _yahoo_collector()
             successes = 0
 
-            for i, ticker in enumerate(tickers_to_scan):
-                try:
-                    # Collect data first
-                    yfc.collect(ticker)
-                    # Then analyze
-                    engine.analyze(ticker)
-                    successes += 1
-                except Exception as e:
-                    st.caption(f"Skipped {ticker}: {e}")
-                progress.progress((i + 1) / len(tickers_to_scan))
+            # Collection is network-bound and runs on the pool; each ticker is
+            # analyzed here as soon as its data is in, overlapping the two phases
+            with ThreadPoolExecutor(max_workers=min(8, len(tickers_to_scan))) as ex:
+                futures = {ex.submit(yfc.collect, t): t for t in tickers_to_scan}
+                for done, future in enumerate(as_completed(futures), 1):
+                    ticker = futures[future]
+                    try:
+                        future.result()
+                        engine.analyze(ticker)
+                        successes += 1
+                    except Exception as e:
+                        st.caption(f"Skipped {ticker}: {e}")
+                    progress.progress(done / len(tickers_to_scan))
             st.success(f"Analyzed {successes} of {len(tickers_to_scan)} stocks!")
             st.rerun()
 
     st.divider()
+    _render_recommendations()
+
+
+@st.fragment
+def _render_recommendations():
+    """Render the filters, overview table and detail cards for stored decisions.
+
+    Runs as a fragment, so changing a filter, sort or limit reruns only this
+    section and not the scanner above (and its last quick-screen table).
+    """
+    db = get_connection()
 
     # === FILTER CONTROLS ===
     col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
@@ -346,20 +507,29 @@ def render():
         "Most Recent": "d.decided_at DESC",
     }.get(sort_by, "d.composite_score DESC")
 
-    # Get latest decision per ticker (across ALL analyzed stocks, not just watchlist)
+    # Get latest decision per ticker (across ALL analyzed stocks, not just watchlist).
+    # MAX(id) per ticker comes straight off idx_decisions_ticker; filtering,
+    # sorting and the limit pick ids first, so the wide display columns are
+    # only read for the rows actually shown.
     query = f"""
-        SELECT d.*, s.company_name, s.sector
-        FROM decisions d
+        WITH shown AS (
+            SELECT d.id
+            FROM decisions d
+            WHERE d.id IN (
+                SELECT MAX(id) FROM decisions GROUP BY ticker
+            ) AND {' AND '.join(where_clauses)}
+            ORDER BY {order}
+            LIMIT ?
+        )
+        SELECT {_DECISION_COLUMNS}, s.company_name, s.sector
+        FROM shown
+        JOIN decisions d ON d.id = shown.id
         LEFT JOIN stocks s ON d.ticker = s.ticker
-        WHERE d.id IN (
-            SELECT MAX(id) FROM decisions GROUP BY ticker
-        ) AND {' AND '.join(where_clauses)}
         ORDER BY {order}
-        LIMIT ?
     """
     params.append(show_limit)
 
-    decisions = list(db.execute(query, tuple(params)))
+    decisions = db.execute(query, tuple(params))
 
     # Show data freshness
     latest_decision = db.execute_one(
@@ -368,6 +538,13 @@ def render():
     if latest_decision and latest_decision.get("last_analyzed"):
         st.caption(f"Latest analysis: {latest_decision['last_analyzed'][:16]}")
 
+    buckets = {"BUY": [], "HOLD": [], "SELL": []}
+    for d in decisions:
+        d["_ext"] = _parse_extended(d)
+        bucket = _ACTION_BUCKET.get(d["action"])
+        if bucket:
+            buckets[bucket].append(d)
+
     if not decisions:
         st.info(
             "No recommendations yet. Select a stock universe above and click "
@@ -376,44 +553,17 @@ def render():
         return
 
     # Summary metrics
-    buys = [d for d in decisions if d["action"] in ("BUY", "STRONG_BUY")]
-    sells = [d for d in decisions if d["action"] in ("SELL", "STRONG_SELL")]
-    holds = [d for d in decisions if d["action"] == "HOLD"]
-
     m1, m2, m3, m4 = st.columns(4)
     m1.metric("Total Analyzed", str(len(decisions)))
-    m2.metric("Buy Signals", str(len(buys)))
-    m3.metric("Hold Signals", str(len(holds)))
-    m4.metric("Sell Signals", str(len(sells)))
+    m2.metric("Buy Signals", str(len(buckets["BUY"])))
+    m3.metric("Hold Signals", str(len(buckets["HOLD"])))
+    m4.metric("Sell Signals", str(len(buckets["SELL"])))
 
     st.divider()
 
     # Quick overview table
     st.subheader("Recommendations Overview")
-    overview_data = []
-    for d in decisions:
-        ext = {}
-        if d.get("extended_data_json"):
-            try:
-                ext = json.loads(d["extended_data_json"])
-            except (json.JSONDecodeError, TypeError):
-                pass
-        targets = ext.get("price_targets", {})
-        upside = targets.get("upside_pct", 0) if targets else 0
-
-        overview_data.append({
-            "Ticker": d["ticker"],
-            "Company": d.get("company_name", "")[:25] if d.get("company_name") else "",
-            "Sector": d.get("sector", "")[:15] if d.get("sector") else "",
-            "Action": d["action"].replace("_", " "),
-            "Score": f"{d['composite_score']:+.1f}",
-            "Confidence": f"{d['confidence']:.0%}" if d.get("confidence") else "N/A",
-            "Position": f"{d['position_size_pct']:.1f}%" if d.get("position_size_pct") else "-",
-            "Upside": f"{upside:+.1f}%" if upside else "-",
-            "Date": d.get("decided_at", "")[:10],
-        })
-
-    st.dataframe(pd.DataFrame(overview_data), width="stretch", hide_index=True)
+    st.dataframe(_overview_frame(decisions), width="stretch", hide_index=True)
 
     teach_if_enabled("composite_score")
     teach_if_enabled("confidence")
@@ -429,46 +579,25 @@ def render():
 
     with tab_buy:
         teach_if_enabled("buy_recommendation")
-        buy_decisions = [d for d in decisions if d["action"] in ("BUY", "STRONG_BUY")]
-        if buy_decisions:
-            for d in buy_decisions:
-                ext = {}
-                if d.get("extended_data_json"):
-                    try:
-                        ext = json.loads(d["extended_data_json"])
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                _render_recommendation_card(d, ext)
+        if buckets["BUY"]:
+            for d in buckets["BUY"]:
+                _render_recommendation_card(d, d["_ext"])
         else:
             st.info("No buy signals at this time. Try scanning a different stock universe.")
 
     with tab_hold:
         teach_if_enabled("hold_recommendation")
-        hold_decisions = [d for d in decisions if d["action"] == "HOLD"]
-        if hold_decisions:
-            for d in hold_decisions:
-                ext = {}
-                if d.get("extended_data_json"):
-                    try:
-                        ext = json.loads(d["extended_data_json"])
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                _render_recommendation_card(d, ext)
+        if buckets["HOLD"]:
+            for d in buckets["HOLD"]:
+                _render_recommendation_card(d, d["_ext"])
         else:
             st.info("No hold signals at this time.")
 
     with tab_sell:
         teach_if_enabled("sell_recommendation")
-        sell_decisions = [d for d in decisions if d["action"] in ("SELL", "STRONG_SELL")]
-        if sell_decisions:
-            for d in sell_decisions:
-                ext = {}
-                if d.get("extended_data_json"):
-                    try:
-                        ext = json.loads(d["extended_data_json"])
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                _render_recommendation_card(d, ext)
+        if buckets["SELL"]:
+            for d in buckets["SELL"]:
+                _render_recommendation_card(d, d["_ext"])
         else:
             st.info("No sell signals at this time. All analyzed stocks look acceptable or better.")
 
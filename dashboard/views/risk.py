@@ -10,18 +10,69 @@ from dashboard.components.tables import kelly_table, stress_test_table
 from dashboard.components.teach_me import teach_if_enabled
 
 
+@st.cache_resource
+def _risk_manager(user_id: int | None) -> RiskManager:
+    """Shared RiskManager per user (it only holds DAOs, settings and the user id)."""
+    return RiskManager(user_id=user_id)
+
+
+@st.cache_data(ttl=900, max_entries=16, show_spinner=False)
+def _cached_risk_report(user_id: int | None, holdings_key: tuple) -> dict:
+    """Full risk report for a user, cached for 15 minutes per holdings snapshot.
+
+    holdings_key only keys the cache (see _holdings_key), so an unchanged
+    portfolio reuses the last VaR / Monte Carlo / stress run.
+    """
+    return _risk_manager(user_id).generate_risk_report()
+
+
+def _holdings_key(rm: RiskManager, user_id: int | None) -> tuple:
+    """(ticker, quantity, market value, sector) per current holding, to key the report cache."""
+    return tuple(
+        (h["ticker"], h["quantity"], h["market_value"], h["sector"])
+        for h in rm.portfolio_dao.get_latest_holdings(user_id)
+    )
+
+
+@st.cache_data(ttl=900, max_entries=16, show_spinner=False)
+def _build_risk_figures(user_id: int | None, generated_at: str, _report: dict) -> dict:
+    """Plotly figures for a risk report, built once per report.
+
+    Keyed on the user and the report's generated_at (the report itself is not
+    hashed). Missing or failed sections map to None.
+    """
+    var_data = _report.get("var", {})
+    mc = _report.get("monte_carlo", {})
+    corr = _report.get("correlation", {})
+    stress = _report.get("stress_tests", [])
+    has_var = "error" not in var_data
+    return {
+        "var_95": create_var_gauge(var_data.get("historical_var_pct", 0), "VaR 95% (5-day)") if has_var else None,
+        "var_99": create_var_gauge(var_data.get("var_99_pct", 0), "VaR 99% (5-day)") if has_var else None,
+        "monte_carlo": (
+            create_monte_carlo_fan_chart(mc["fan_chart"], mc.get("portfolio_value", 0))
+            if "error" not in mc and mc.get("fan_chart") else None
+        ),
+        "correlation": (
+            create_correlation_heatmap(corr["tickers"], corr["correlation_matrix"])
+            if "error" not in corr and corr.get("correlation_matrix") and corr.get("tickers") else None
+        ),
+        "stress": create_stress_test_chart(stress) if stress and "error" not in stress[0] else None,
+    }
+
+
 def render():
     """Render the risk dashboard page."""
     st.header("Risk Dashboard")
 
     from dashboard.components.auth import get_current_user_id
     user_id = get_current_user_id()
-    rm = RiskManager(user_id=user_id)
+    rm = _risk_manager(user_id)
 
     # Generate report button
     if st.button("Generate Risk Report", type="primary"):
         with st.spinner("Running risk analysis (VaR, Monte Carlo, stress tests...)"):
-            report = rm.generate_risk_report()
+            report = _cached_risk_report(user_id, _holdings_key(rm, user_id))
             st.session_state["risk_report"] = report
 
     report = st.session_state.get("risk_report")
@@ -39,6 +90,8 @@ def render():
             col4.metric("HHI Index", f"{summary['hhi']:.4f}")
         return
 
+    figures = _build_risk_figures(user_id, report.get("generated_at", ""), report)
+
     # === VaR Section ===
     st.subheader("Value at Risk")
     teach_if_enabled("var")
@@ -47,18 +100,10 @@ def render():
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            fig = create_var_gauge(
-                var_data.get("historical_var_pct", 0),
-                "VaR 95% (5-day)"
-            )
-            st.plotly_chart(fig, width="stretch")
+            st.plotly_chart(figures["var_95"], width="stretch")
 
         with col2:
-            fig = create_var_gauge(
-                var_data.get("var_99_pct", 0),
-                "VaR 99% (5-day)"
-            )
-            st.plotly_chart(fig, width="stretch")
+            st.plotly_chart(figures["var_99"], width="stretch")
 
         with col3:
             st.metric("95% VaR ($)", f"${var_data.get('historical_var_dollar', 0):,.2f}")
@@ -76,12 +121,8 @@ def render():
     mc = report.get("monte_carlo", {})
     if "error" not in mc:
         # Fan chart
-        if mc.get("fan_chart"):
-            fig = create_monte_carlo_fan_chart(
-                mc["fan_chart"],
-                mc.get("portfolio_value", 0),
-            )
-            st.plotly_chart(fig, width="stretch")
+        if figures["monte_carlo"] is not None:
+            st.plotly_chart(figures["monte_carlo"], width="stretch")
 
         # Key metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -108,9 +149,8 @@ def render():
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            if corr.get("correlation_matrix") and corr.get("tickers"):
-                fig = create_correlation_heatmap(corr["tickers"], corr["correlation_matrix"])
-                st.plotly_chart(fig, width="stretch")
+            if figures["correlation"] is not None:
+                st.plotly_chart(figures["correlation"], width="stretch")
 
         with col2:
             div_ratio = corr.get("diversification_ratio", 0)
@@ -130,9 +170,8 @@ def render():
     # === Stress Tests ===
     st.subheader("Stress Tests")
     stress = report.get("stress_tests", [])
-    if stress and "error" not in stress[0]:
-        fig = create_stress_test_chart(stress)
-        st.plotly_chart(fig, width="stretch")
+    if figures["stress"] is not None:
+        st.plotly_chart(figures["stress"], width="stretch")
         stress_test_table(stress)
     else:
         st.info("No stress test results available.")
@@ -1,5 +1,7 @@
 """Stock Screener Dashboard Page."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import streamlit as st
 import pandas as pd
 import yfinance as yf
@@ -9,6 +11,11 @@ from database.models import StockDAO, UserWatchlistDAO
 from dashboard.components.auth import get_current_user_id
 
 
+def _fetch_info(ticker: str) -> dict:
+    """yfinance info for one ticker; network-bound, so safe to run on a worker thread."""
+    return yf.Ticker(ticker).info
+
+
 def render():
     """Render the stock screener page."""
     st.header("Stock Screener")
@@ -28,21 +35,23 @@ def render():
             if st.button("Add to Watchlist", key="wl_add_btn"):
                 if add_input:
                     tickers = [t.strip().upper() for t in add_input.split(",") if t.strip()]
-                    for t in tickers:
-                        try:
-                            stock = yf.Ticker(t)
-                            info = stock.info
-                            stock_dao.upsert(
-                                ticker=t,
-                                company_name=info.get("longName", info.get("shortName", "")),
-                                sector=info.get("sector", ""),
-                                industry=info.get("industry", ""),
-                                market_cap=info.get("marketCap"),
-                            )
-                            wl_dao.add(user_id, t)
-                            st.success(f"Added {t} ({info.get('longName', '')})")
-                        except Exception as e:
-                            st.error(f"Failed to add {t}: {e}")
+                    with ThreadPoolExecutor(max_workers=min(16, len(tickers)) or 1) as ex:
+                        futures = {ex.submit(_fetch_info, t): t for t in tickers}
+                        for future in as_completed(futures):
+                            t = futures[future]
+                            try:
+                                info = future.result()
+                                stock_dao.upsert(
+                                    ticker=t,
+                                    company_name=info.get("longName", info.get("shortName", "")),
+                                    sector=info.get("sector", ""),
+                                    industry=info.get("industry", ""),
+                                    market_cap=info.get("marketCap"),
+                                )
+                                wl_dao.add(user_id, t)
+                                st.success(f"Added {t} ({info.get('longName', '')})")
+                            except Exception as e:
+                                st.error(f"Failed to add {t}: {e}")
                     st.rerun()
 
         with col_remove:
@@ -55,14 +64,52 @@ def render():
                 st.success(f"Removed {len(tickers_to_remove)} ticker(s)")
                 st.rerun()
 
-    # Get user's watchlist stocks with details
+    # Get user's watchlist stocks with their latest decision, scores and DCF in one pass
     user_tickers = wl_dao.get_tickers(user_id)
     if user_tickers:
         placeholders = ",".join("?" for _ in user_tickers)
-        stocks = list(db.execute(
-            f"SELECT ticker, company_name, sector, industry, market_cap FROM stocks WHERE ticker IN ({placeholders}) ORDER BY ticker",
-            tuple(user_tickers),
-        ))
+        stocks = db.execute(
+            f"""
+            WITH latest_decisions AS (
+                SELECT ticker, composite_score, confidence, action,
+                       ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY decided_at DESC, id DESC) AS rn
+                FROM decisions
+                WHERE ticker IN ({placeholders})
+            ),
+            latest_scores AS (
+                SELECT ticker, score_type, score_value,
+                       ROW_NUMBER() OVER (PARTITION BY ticker, score_type ORDER BY computed_at DESC) AS rn
+                FROM computed_scores
+                WHERE ticker IN ({placeholders})
+            ),
+            scores AS (
+                SELECT ticker,
+                       MAX(CASE WHEN score_type = 'piotroski' THEN score_value END) AS piotroski,
+                       MAX(CASE WHEN score_type = 'altman_z' THEN score_value END) AS altman_z,
+                       MAX(CASE WHEN score_type = 'beneish_m' THEN score_value END) AS beneish_m
+                FROM latest_scores
+                WHERE rn = 1
+                GROUP BY ticker
+            ),
+            latest_dcf AS (
+                SELECT ticker, margin_of_safety,
+                       ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY computed_at DESC, id DESC) AS rn
+                FROM dcf_valuations
+                WHERE ticker IN ({placeholders})
+            )
+            SELECT s.ticker, s.company_name, s.sector, s.industry, s.market_cap,
+                   d.composite_score, d.confidence, d.action,
+                   sc.piotroski, sc.altman_z, sc.beneish_m,
+                   dcf.margin_of_safety
+            FROM stocks s
+            LEFT JOIN latest_decisions d ON d.ticker = s.ticker AND d.rn = 1
+            LEFT JOIN scores sc ON sc.ticker = s.ticker
+            LEFT JOIN latest_dcf dcf ON dcf.ticker = s.ticker AND dcf.rn = 1
+            WHERE s.ticker IN ({placeholders})
+            ORDER BY s.ticker
+            """,
+            tuple(user_tickers) * 4,
+        )
     else:
         stocks = []
 
@@ -99,40 +146,22 @@ def render():
             "Sector": s.get("sector", "N/A"),
         }
 
-        # Get latest decision
-        decision = db.execute_one(
-            "SELECT composite_score, confidence, action FROM decisions WHERE ticker = ? ORDER BY decided_at DESC LIMIT 1",
-            (ticker,),
-        )
-        if decision:
-            row["Score"] = decision["composite_score"]
-            row["Action"] = decision["action"]
-            row["Confidence"] = f"{decision['confidence']:.0%}" if decision.get("confidence") else "N/A"
+        # Latest decision (action is NOT NULL, so None means no decision yet)
+        if s["action"] is not None:
+            row["Score"] = s["composite_score"]
+            row["Action"] = s["action"]
+            row["Confidence"] = f"{s['confidence']:.0%}" if s.get("confidence") else "N/A"
         else:
             row["Score"] = None
             row["Action"] = "N/A"
             row["Confidence"] = "N/A"
 
-        # Get computed scores
-        scores = list(db.execute(
-            """SELECT score_type, score_value FROM computed_scores
-               WHERE ticker = ? AND computed_at = (
-                   SELECT MAX(computed_at) FROM computed_scores WHERE ticker = ? AND score_type = computed_scores.score_type
-               )""",
-            (ticker, ticker),
-        ))
-
-        score_map = {s["score_type"]: s["score_value"] for s in scores}
-        row["Piotroski"] = score_map.get("piotroski")
-        row["Altman Z"] = score_map.get("altman_z")
-        row["Beneish M"] = score_map.get("beneish_m")
+        row["Piotroski"] = s["piotroski"]
+        row["Altman Z"] = s["altman_z"]
+        row["Beneish M"] = s["beneish_m"]
 
         # DCF margin of safety
-        dcf = db.execute_one(
-            "SELECT margin_of_safety FROM dcf_valuations WHERE ticker = ? ORDER BY computed_at DESC LIMIT 1",
-            (ticker,),
-        )
-        row["DCF MoS %"] = dcf["margin_of_safety"] if dcf and dcf.get("margin_of_safety") else None
+        row["DCF MoS %"] = s["margin_of_safety"] if s.get("margin_of_safety") else None
 
         # Apply filters
         if min_piotroski > 0 and (row["Piotroski"] is None or row["Piotroski"] < min_piotroski):
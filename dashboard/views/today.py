@@ -14,16 +14,6 @@ from dashboard.data.market_data import (
 )
 
 
-def _safe_val(v, default=0):
-    """Safely convert to float."""
-    try:
-        import math
-        f = float(v) if v is not None else default
-        return default if math.isnan(f) else f
-    except (ValueError, TypeError):
-        return default
-
-
 def _render_market_pulse():
     """Section 1: Market Pulse — indices + fear/greed + status."""
     indices = get_market_indices()
@@ -84,7 +74,7 @@ def _render_market_pulse():
 def _render_portfolio_summary(user_id: int):
     """Section 2: Portfolio summary — value, P&L, top movers."""
     from database.models import PortfolioDAO
-    from dashboard.views.portfolio import _get_live_prices, _apply_live_prices
+    from dashboard.views.portfolio import _get_live_prices, _apply_live_prices, _holdings_frame
 
     portfolio_dao = PortfolioDAO()
     holdings = list(portfolio_dao.get_latest_holdings(user_id))
@@ -98,13 +88,13 @@ def _render_portfolio_summary(user_id: int):
     if live_prices:
         holdings = _apply_live_prices(holdings, live_prices)
 
-    total_value = sum(_safe_val(h.get("market_value")) for h in holdings)
-    total_cost = sum(_safe_val(h.get("average_cost", 0)) * _safe_val(h.get("quantity", 0))
-                     for h in holdings)
-    total_pl = sum(_safe_val(h.get("unrealized_pl")) for h in holdings)
+    # One coercion pass (None/NaN/non-numeric -> 0) instead of a per-value guard
+    hdf = _holdings_frame(holdings)
+    total_value = float(hdf["market_value"].sum())
+    total_cost = float((hdf["average_cost"] * hdf["quantity"]).sum())
+    total_pl = float(hdf["unrealized_pl"].sum())
     total_pl_pct = (total_pl / total_cost * 100) if total_cost > 0 else 0
-    daily_change = sum(_safe_val(h.get("_daily_change", 0)) * _safe_val(h.get("quantity", 0))
-                       for h in holdings)
+    daily_change = float((hdf["_daily_change"] * hdf["quantity"]).sum())
 
     # Large metrics
     c1, c2, c3 = st.columns(3)
@@ -114,26 +104,22 @@ def _render_portfolio_summary(user_id: int):
     c3.metric("Total P&L", f"${total_pl:+,.0f}", delta=f"{total_pl_pct:+.1f}%")
 
     # Top winners and losers
-    sorted_by_daily = sorted(holdings,
-                             key=lambda h: _safe_val(h.get("_daily_change_pct")),
-                             reverse=True)
-    winners = [h for h in sorted_by_daily if _safe_val(h.get("_daily_change_pct")) > 0][:5]
-    losers = [h for h in reversed(sorted_by_daily) if _safe_val(h.get("_daily_change_pct")) < 0][:5]
+    daily_pct = hdf["_daily_change_pct"]
+    winners = hdf[daily_pct > 0].sort_values("_daily_change_pct", ascending=False, kind="stable").head(5)
+    losers = hdf[daily_pct < 0].sort_values("_daily_change_pct", kind="stable").head(5)
 
-    if winners or losers:
+    if not winners.empty or not losers.empty:
         col_w, col_l = st.columns(2)
         with col_w:
-            if winners:
+            if not winners.empty:
                 st.markdown("**Top Winners**")
-                for h in winners:
-                    pct = _safe_val(h.get("_daily_change_pct"))
-                    st.markdown(f':green[{h["ticker"]}  {pct:+.1f}%]')
+                for ticker, pct in zip(winners["ticker"], winners["_daily_change_pct"]):
+                    st.markdown(f':green[{ticker}  {pct:+.1f}%]')
         with col_l:
-            if losers:
+            if not losers.empty:
                 st.markdown("**Top Losers**")
-                for h in losers:
-                    pct = _safe_val(h.get("_daily_change_pct"))
-                    st.markdown(f':red[{h["ticker"]}  {pct:+.1f}%]')
+                for ticker, pct in zip(losers["ticker"], losers["_daily_change_pct"]):
+                    st.markdown(f':red[{ticker}  {pct:+.1f}%]')
 
 
 def _render_ratings_signals():
@@ -211,11 +197,25 @@ def _render_events_today():
         st.caption("No economic events today.")
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_smart_alerts(user_id: int, snapshot_date: str) -> list[dict]:
+    """Rule-based smart alerts for a holdings snapshot (cached 5 min).
+
+    snapshot_date is only part of the cache key, so adding or removing a
+    holding (which writes a new snapshot) invalidates the cached alerts.
+    """
+    from analysis.alerts import get_smart_alerts
+    return get_smart_alerts(user_id)
+
+
 def _render_smart_alerts(user_id: int):
     """Section 4: Smart alerts."""
     try:
-        from analysis.alerts import get_smart_alerts
-        alerts = get_smart_alerts(user_id)
+        from database.models import PortfolioDAO
+        snapshot_date = PortfolioDAO().get_latest_snapshot_date(user_id)
+        if not snapshot_date:
+            return  # No holdings, so no alerts to compute
+        alerts = _cached_smart_alerts(user_id, snapshot_date)
     except Exception:
         alerts = []
 
@@ -60,9 +60,9 @@ class DatabaseConnection:
             return cursor.lastrowid
 
     def execute_many(self, sql: str, param_list: list):
-        """Execute a parameterized query for each set of params."""
+        """Execute a parameterized query for each set of params. Returns the number of rows changed."""
         with self.connect() as conn:
-            conn.executemany(sql, param_list)
+            return conn.executemany(sql, param_list).rowcount
 
 
 _db: DatabaseConnection | None = None
@@ -5,6 +5,9 @@ import json
 import logging
 import secrets
 from datetime import datetime
+
+import numpy as np
+
 from database.connection import get_connection
 from utils.validators import validate_ticker, validate_price, validate_amount, guard_nan
 
@@ -134,6 +137,15 @@ class UserWatchlistDAO:
             (user_id, ticker),
         )
 
+    def add_many(self, user_id: int, tickers: list[str]):
+        """Add several tickers to a user's watchlist in one executemany."""
+        params = [(user_id, validate_ticker(t)) for t in tickers]
+        if params:
+            self.db.execute_many(
+                "INSERT OR IGNORE INTO user_watchlist (user_id, ticker) VALUES (?, ?)",
+                params,
+            )
+
     def remove(self, user_id: int, ticker: str):
         ticker = validate_ticker(ticker)
         self.db.execute(
@@ -190,9 +202,47 @@ class StockDAO:
             (ticker, company_name, sector, industry, cik, country, market_cap),
         )
 
+    def upsert_many(self, rows: list[dict]):
+        """Upsert several stocks in one executemany, with the same merge rules as upsert.
+
+        Each row takes upsert's keyword arguments; ticker is required.
+        """
+        params = [
+            (validate_ticker(r["ticker"]), r.get("company_name"), r.get("sector"),
+             r.get("industry"), r.get("cik"), r.get("country", "US"),
+             validate_price(r.get("market_cap")))
+            for r in rows
+        ]
+        if not params:
+            return
+        self.db.execute_many(
+            """INSERT INTO stocks (ticker, company_name, sector, industry, cik, country, market_cap)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(ticker) DO UPDATE SET
+                 company_name=COALESCE(excluded.company_name, company_name),
+                 sector=COALESCE(excluded.sector, sector),
+                 industry=COALESCE(excluded.industry, industry),
+                 cik=COALESCE(excluded.cik, cik),
+                 country=COALESCE(excluded.country, country),
+                 market_cap=COALESCE(excluded.market_cap, market_cap)""",
+            params,
+        )
+
     def get(self, ticker: str):
         return self.db.execute_one("SELECT * FROM stocks WHERE ticker = ?", (ticker,))
 
+    def get_sectors(self, tickers: list[str]) -> dict[str, str]:
+        """Known sectors for tickers as {ticker: sector}; tickers with no stored sector are omitted."""
+        if not tickers:
+            return {}
+        placeholders = ",".join("?" * len(tickers))
+        rows = self.db.execute(
+            f"""SELECT ticker, sector FROM stocks
+                WHERE ticker IN ({placeholders}) AND sector IS NOT NULL AND sector != ''""",
+            tuple(tickers),
+        )
+        return {r["ticker"]: r["sector"] for r in rows}
+
     def get_all_active(self):
         return self.db.execute("SELECT * FROM stocks WHERE is_active = 1")
 
@@ -357,6 +407,22 @@ class DecisionDAO:
             (ticker,),
         )
 
+    def get_latest_for_tickers(self, tickers: list[str]) -> list[dict]:
+        """Latest decision for each of several tickers in one query (ties go to the newest row)."""
+        if not tickers:
+            return []
+        placeholders = ",".join("?" * len(tickers))
+        return self.db.execute(
+            f"""SELECT d.* FROM decisions d JOIN (
+                   SELECT id, ROW_NUMBER() OVER (
+                       PARTITION BY ticker ORDER BY decided_at DESC, id DESC
+                   ) AS rn
+                   FROM decisions WHERE ticker IN ({placeholders})
+               ) latest ON latest.id = d.id
+               WHERE latest.rn = 1""",
+            tuple(tickers),
+        )
+
     def get_pending_outcomes(self):
         return self.db.execute(
             """SELECT * FROM decisions
@@ -396,6 +462,58 @@ class NewsDAO:
         except Exception as e:
             logger.debug("News insert skipped (likely duplicate): %s", e)
 
+    def insert_many(self, articles: list[dict]) -> int:
+        """Insert articles in one executemany; duplicates and rows missing a title/source are skipped.
+
+        Returns the number of new rows.
+        """
+        params = [
+            (
+                a.get("title"), a.get("summary"),
+                a.get("source"), a.get("url"),
+                a.get("published_at"), a.get("ticker"),
+                a.get("credibility_weight", 0.7),
+                a.get("sentiment_score"),
+            )
+            for a in articles
+        ]
+        if not params:
+            return 0
+        return self.db.execute_many(
+            """INSERT OR IGNORE INTO news_articles
+               (title, summary, source, url, published_at, ticker,
+                credibility_weight, sentiment_score)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            params,
+        )
+
+    def get_latest_by_category(self, categories: dict[str, tuple[list[str], int]]) -> dict[str, list[dict]]:
+        """Latest articles for several ticker groups in one query.
+
+        `categories` maps a category name to (tickers, per-ticker limit). A
+        ticker may appear in more than one category. Returns a dict with a
+        list per category (empty if nothing is stored), newest first.
+        """
+        values = [(t, cat, limit) for cat, (tickers, limit) in categories.items() for t in tickers]
+        result = {cat: [] for cat in categories}
+        if not values:
+            return result
+        rows = self.db.execute(
+            f"""WITH t(ticker, cat, lim) AS (VALUES {",".join(["(?, ?, ?)"] * len(values))})
+                SELECT id, title, summary, source, url, published_at, ticker,
+                       credibility_weight, sentiment_score, fetched_at, cat FROM (
+                    SELECT n.*, t.cat, t.lim, ROW_NUMBER() OVER (
+                        PARTITION BY t.cat, n.ticker ORDER BY n.published_at DESC
+                    ) AS rn
+                    FROM news_articles n JOIN t ON n.ticker = t.ticker
+                ) WHERE rn <= lim
+                ORDER BY published_at DESC""",
+            tuple(v for row in values for v in row),
+        )
+        for row in rows:
+            result[row.pop("cat")].append(row)
+        return result
+
     def get_recent(self, ticker: str = None, days: int = 30, limit: int = 100):
         if ticker:
             return self.db.execute(
@@ -439,6 +557,43 @@ class MacroDAO:
             (series_id,),
         )
 
+    def get_last_fetched(self, series_ids: list[str]) -> dict[str, str]:
+        """Latest fetched_at per series, usable as a data version for cache keys.
+
+        INSERT OR REPLACE resets fetched_at, so this moves on every ingest,
+        including revisions to already-stored dates.
+        """
+        if not series_ids:
+            return {}
+        placeholders = ",".join("?" * len(series_ids))
+        rows = self.db.execute(
+            f"""SELECT series_id, MAX(fetched_at) AS last_fetched FROM macro_indicators
+               WHERE series_id IN ({placeholders}) GROUP BY series_id""",
+            tuple(series_ids),
+        )
+        return {r["series_id"]: r["last_fetched"] for r in rows}
+
+    def get_series_columns(self, series_id: str, limit: int = 120) -> tuple[np.ndarray, np.ndarray]:
+        """Fetch the latest `limit` points of a series as column arrays, oldest first.
+
+        Returns (dates, values) with dates as datetime64[D] and values as
+        float32 (NULL becomes NaN), for callers that only plot or compute.
+        """
+        rows = self.db.execute(
+            """SELECT date, value FROM (
+                   SELECT date, value FROM macro_indicators
+                   WHERE series_id = ? ORDER BY date DESC LIMIT ?
+               ) ORDER BY date""",
+            (series_id, limit),
+        )
+        n = len(rows)
+        dates = np.empty(n, dtype="datetime64[D]")
+        values = np.empty(n, dtype=np.float32)
+        for i, r in enumerate(rows):
+            dates[i] = r["date"]
+            values[i] = np.nan if r["value"] is None else r["value"]
+        return dates, values
+
 
 class PortfolioDAO:
     """Data access for portfolio data."""
@@ -447,21 +602,32 @@ class PortfolioDAO:
         self.db = db or get_connection()
 
     def snapshot_holdings(self, holdings: list[dict], user_id: int = None):
+        """Write holdings as a new snapshot in one executemany.
+
+        Every ticker is validated before anything is written, so an invalid
+        one can't leave a partial snapshot behind.
+        """
         now = datetime.now().isoformat()
         for h in holdings:
             h["ticker"] = validate_ticker(h["ticker"])
-            self.db.execute_insert(
-                """INSERT INTO portfolio_holdings
-                   (ticker, quantity, average_cost, current_price,
-                    market_value, unrealized_pl, unrealized_pl_pct, sector, snapshot_date, user_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    h["ticker"], h["quantity"], h.get("average_cost"),
-                    h.get("current_price"), h.get("market_value"),
-                    h.get("unrealized_pl"), h.get("unrealized_pl_pct"),
-                    h.get("sector"), now, user_id,
-                ),
+        params = [
+            (
+                h["ticker"], h["quantity"], h.get("average_cost"),
+                h.get("current_price"), h.get("market_value"),
+                h.get("unrealized_pl"), h.get("unrealized_pl_pct"),
+                h.get("sector"), now, user_id,
             )
+            for h in holdings
+        ]
+        if not params:
+            return
+        self.db.execute_many(
+            """INSERT INTO portfolio_holdings
+               (ticker, quantity, average_cost, current_price,
+                market_value, unrealized_pl, unrealized_pl_pct, sector, snapshot_date, user_id)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            params,
+        )
 
     def get_latest_holdings(self, user_id: int = None):
         if user_id is not None:
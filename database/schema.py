@@ -557,6 +557,8 @@ INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_sec_financial_ticker ON sec_financial_data(ticker)",
     "CREATE INDEX IF NOT EXISTS idx_news_ticker ON news_articles(ticker)",
     "CREATE INDEX IF NOT EXISTS idx_news_published ON news_articles(published_at)",
+    "CREATE INDEX IF NOT EXISTS idx_news_ticker_pub ON news_articles(ticker, published_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_news_fetched ON news_articles(fetched_at)",
     "CREATE INDEX IF NOT EXISTS idx_analysis_ticker ON analysis_results(ticker)",
     "CREATE INDEX IF NOT EXISTS idx_analysis_analyzer ON analysis_results(analyzer_name)",
     "CREATE INDEX IF NOT EXISTS idx_decisions_ticker ON decisions(ticker)",
@@ -409,19 +409,17 @@ class RiskManager:
             # Run simulations using geometric Brownian motion
             np.random.seed(42)
             simulated_returns = np.random.normal(mu, sigma, (num_simulations, horizon_days))
-            simulated_paths = total_value * np.cumprod(1 + simulated_returns, axis=1)
+            # Growth factors in place, then scale: no extra (sims x days) temporaries
+            simulated_returns += 1
+            simulated_paths = np.cumprod(simulated_returns, axis=1, out=simulated_returns)
+            simulated_paths *= total_value
 
             final_values = simulated_paths[:, -1]
 
-            # Calculate percentiles
+            # Calculate percentiles (one partition pass for all of them)
+            pct_levels = (5, 10, 25, 50, 75, 90, 95)
             percentiles = {
-                "p5": float(np.percentile(final_values, 5)),
-                "p10": float(np.percentile(final_values, 10)),
-                "p25": float(np.percentile(final_values, 25)),
-                "p50": float(np.percentile(final_values, 50)),
-                "p75": float(np.percentile(final_values, 75)),
-                "p90": float(np.percentile(final_values, 90)),
-                "p95": float(np.percentile(final_values, 95)),
+                f"p{q}": float(v) for q, v in zip(pct_levels, np.percentile(final_values, pct_levels))
             }
 
             # Probability of various returns
@@ -434,10 +432,11 @@ class RiskManager:
             sample_indices = np.linspace(0, num_simulations - 1, 10, dtype=int)
             sample_paths = simulated_paths[sample_indices].tolist()
 
-            # Percentile paths for fan chart
-            p10_path = np.percentile(simulated_paths, 10, axis=0).tolist()
-            p50_path = np.percentile(simulated_paths, 50, axis=0).tolist()
-            p90_path = np.percentile(simulated_paths, 90, axis=0).tolist()
+            # Percentile paths for fan chart, only on the days kept after downsampling for storage
+            fan_step = max(1, horizon_days // 50)
+            p10_path, p50_path, p90_path = np.percentile(
+                simulated_paths[:, ::fan_step], (10, 50, 90), axis=0,
+            ).tolist()
 
             result = {
                 "portfolio_value": round(total_value, 2),
@@ -453,11 +452,7 @@ class RiskManager:
                 "prob_10pct_gain": round(prob_10pct_gain, 3),
                 "prob_10pct_loss": round(prob_10pct_loss, 3),
                 "prob_25pct_loss": round(prob_25pct_loss, 3),
-                "fan_chart": {
-                    "p10": p10_path[::max(1, len(p10_path) // 50)],  # Downsample for storage
-                    "p50": p50_path[::max(1, len(p50_path) // 50)],
-                    "p90": p90_path[::max(1, len(p90_path) // 50)],
-                },
+                "fan_chart": {"p10": p10_path, "p50": p50_path, "p90": p90_path},
                 "annualized_return_mu": round(mu * 252 * 100, 2),
                 "annualized_volatility": round(sigma * np.sqrt(252) * 100, 2),
             }
@@ -536,16 +531,18 @@ class RiskManager:
             # Correlation matrix
             corr_matrix = np.corrcoef(aligned)
 
+            # Upper-triangle pairs (i < j, row-major); NaN from flat series never qualifies
+            rows, cols = np.triu_indices_from(corr_matrix, k=1)
+            pair_corrs = corr_matrix[rows, cols]
+            abs_corrs = np.abs(pair_corrs)
+            known = ~np.isnan(abs_corrs)
+
             # Find highly correlated pairs (>0.8)
-            high_corr_pairs = []
-            for i in range(len(tickers)):
-                for j in range(i + 1, len(tickers)):
-                    corr = corr_matrix[i, j]
-                    if abs(corr) > 0.8:
-                        high_corr_pairs.append({
-                            "pair": f"{tickers[i]}/{tickers[j]}",
-                            "correlation": round(float(corr), 3),
-                        })
+            high = np.flatnonzero(abs_corrs > 0.8)
+            high_corr_pairs = [
+                {"pair": f"{tickers[rows[k]]}/{tickers[cols[k]]}", "correlation": round(float(pair_corrs[k]), 3)}
+                for k in high
+            ]
 
             # Diversification ratio
             individual_vols = np.std(aligned, axis=1)
@@ -554,10 +551,7 @@ class RiskManager:
             portfolio_vol = np.sqrt(np.dot(weights, np.dot(cov_matrix, weights)))
             diversification_ratio = weighted_individual_vol / portfolio_vol if portfolio_vol > 0 else 1.0
 
-            max_corr = 0.0
-            for i in range(len(tickers)):
-                for j in range(i + 1, len(tickers)):
-                    max_corr = max(max_corr, abs(float(corr_matrix[i, j])))
+            max_corr = float(np.max(abs_corrs, initial=0.0, where=known))
 
             result = {
                 "tickers": tickers,
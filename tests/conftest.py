@@ -78,6 +78,24 @@ def recurring_investment_dao(test_db):
     return RecurringInvestmentDAO(db=test_db)
 
 
+@pytest.fixture
+def user_watchlist_dao(test_db):
+    from database.models import UserWatchlistDAO
+    return UserWatchlistDAO(db=test_db)
+
+
+@pytest.fixture
+def news_dao(test_db):
+    from database.models import NewsDAO
+    return NewsDAO(db=test_db)
+
+
+@pytest.fixture
+def macro_dao(test_db):
+    from database.models import MacroDAO
+    return MacroDAO(db=test_db)
+
+
 @pytest.fixture
 def sample_stock():
     return {
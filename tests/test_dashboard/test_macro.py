@@ -0,0 +1,85 @@
+"""Tests for macro page series helpers."""
+
+import numpy as np
+
+from dashboard.views.macro import _align_start, _decimate, _quantize_sparkline, _regimes_key
+
+
+def _series(n):
+    dates = np.array([f"d{i}" for i in range(n)], dtype=object)
+    values = np.sin(np.linspace(0, 20, n)).astype(np.float32)
+    return dates, values
+
+
+class TestDecimate:
+    def test_short_series_unchanged(self):
+        dates, values = _series(120)
+        out_dates, out_values = _decimate(dates, values, target=500)
+        assert out_dates is dates
+        assert out_values is values
+
+    def test_reduces_to_target(self):
+        dates, values = _series(5000)
+        out_dates, out_values = _decimate(dates, values, target=500)
+        assert len(out_dates) == len(out_values) == 500
+        assert out_values.dtype == np.float32
+
+    def test_keeps_endpoints_and_order(self):
+        dates, values = _series(5000)
+        out_dates, _ = _decimate(dates, values, target=500)
+        assert out_dates[0] == "d0"
+        assert out_dates[-1] == "d4999"
+        positions = [int(d[1:]) for d in out_dates]
+        assert positions == sorted(set(positions))
+
+    def test_preserves_extremes(self):
+        dates, values = _series(5000)
+        values[1234] = 50.0
+        values[4321] = -50.0
+        _, out_values = _decimate(dates, values, target=200)
+        assert out_values.max() == 50.0
+        assert out_values.min() == -50.0
+
+
+class TestAlignStart:
+    def test_trims_to_latest_start(self):
+        daily = np.arange("2024-01-01", "2024-03-01", dtype="datetime64[D]")
+        weekly = np.arange("2023-06-05", "2024-03-01", 7, dtype="datetime64[D]")
+        short = daily[-20:]
+        empty = np.array([], dtype="datetime64[D]")
+        out = _align_start({
+            "daily": (daily, np.arange(len(daily), dtype=np.float32)),
+            "weekly": (weekly, np.arange(len(weekly), dtype=np.float32)),
+            "short": (short, np.zeros(len(short), dtype=np.float32)),
+            "empty": (empty, np.array([], dtype=np.float32)),
+        })
+        assert len(out["short"][0]) == 20
+        assert out["daily"][0][0] == short[0]
+        assert out["daily"][1][0] == len(daily) - 20
+        assert short[0] <= out["weekly"][0][0] < short[0] + 7
+        assert len(out["empty"][0]) == 0
+
+
+class TestQuantizeSparkline:
+    def test_scaled_to_int8_range(self):
+        out = _quantize_sparkline([300.0, 301.5, 303.0])
+        assert out.dtype == np.int8
+        assert out[0] == 0
+        assert out[-1] == 127
+        assert out[0] < out[1] < out[2]
+
+    def test_flat_and_missing_values(self):
+        assert list(_quantize_sparkline([5.0, 5.0, None])) == [0, 0]
+        assert _quantize_sparkline([None]).size == 0
+
+
+class TestRegimesKey:
+    def test_order_independent(self):
+        a = {"growth": "high", "inflation": "low", "vix": 18.5}
+        b = {"vix": 18.5, "inflation": "low", "growth": "high"}
+        assert _regimes_key(a) == _regimes_key(b)
+        assert _regimes_key(a) != _regimes_key({**a, "vix": 19.0})
+
+    def test_unhashable_values_fall_back_to_digest(self):
+        key = _regimes_key({"growth": "high", "history": [1, 2]})
+        assert isinstance(key, str) and len(key) == 16
@@ -0,0 +1,70 @@
+"""Tests for news page helpers."""
+
+from dashboard.views.news import (
+    _canonical_url, _dedupe_and_sort, _format_pub_dates, _get_credibility_score,
+)
+
+
+class TestDedupeAndSort:
+    def test_newest_first_and_blank_titles_dropped(self):
+        articles = [
+            {"title": "Old", "published_at": "2024-01-01"},
+            {"title": "", "published_at": "2024-01-03"},
+            {"title": "New", "published_at": "2024-01-02"},
+        ]
+        assert [a["title"] for a in _dedupe_and_sort(articles)] == ["New", "Old"]
+
+    def test_cosmetic_title_variants_are_duplicates(self):
+        articles = [
+            {"title": "Fed  holds rates", "source": "Reuters", "published_at": "2024-01-01"},
+            {"title": "FED HOLDS RATES", "source": "CNBC", "published_at": "2024-01-01"},
+            {"title": "Ｆｅｄ holds rates\n", "source": "AP", "published_at": "2024-01-01"},
+        ]
+        result = _dedupe_and_sort(articles)
+        assert [a["source"] for a in result] == ["Reuters"]
+
+    def test_falls_back_to_fetched_at(self):
+        articles = [
+            {"title": "A", "published_at": None, "fetched_at": "2024-01-05"},
+            {"title": "B", "published_at": "2024-01-02"},
+        ]
+        assert [a["title"] for a in _dedupe_and_sort(articles)] == ["A", "B"]
+
+
+class TestFormatPubDates:
+    def test_formats_batch_with_fallbacks(self):
+        articles = [
+            {"published_at": "2024-03-01T14:05:00Z"},
+            {"published_at": None, "fetched_at": "2024-03-02 09:30:00"},
+            {"published_at": "sometime last week, probably"},
+            {},
+        ]
+        _format_pub_dates(articles)
+        assert [a["pub_display"] for a in articles] == [
+            "Mar 01, 2024 02:05 PM",
+            "Mar 02, 2024 09:30 AM",
+            "sometime last we",
+            "",
+        ]
+
+
+class TestGetCredibilityScore:
+    def test_exact_and_fuzzy_matches(self):
+        assert _get_credibility_score("Reuters") == 1.0
+        assert _get_credibility_score("bbc news online") == 0.90
+        assert _get_credibility_score("Unknown Blog") == 0.6
+        assert _get_credibility_score("") == 0.5
+
+    def test_longest_matching_name_wins(self):
+        # "times" is inside both "the new york times" and "financial times"
+        assert _get_credibility_score("Times") == 0.90
+
+
+class TestCanonicalUrl:
+    def test_strips_tracking_params_fragment_and_trailing_slash(self):
+        url = "HTTPS://Finance.Yahoo.com/news/fed-holds/?.tsrc=rss&utm_source=x&id=7#comments"
+        assert _canonical_url(url) == "https://finance.yahoo.com/news/fed-holds?id=7"
+
+    def test_empty_passthrough(self):
+        assert _canonical_url(None) is None
+        assert _canonical_url("") == ""
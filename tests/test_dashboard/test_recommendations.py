@@ -0,0 +1,25 @@
+"""Tests for recommendations page helpers."""
+
+from dashboard.views.recommendations import _overview_frame
+
+
+class TestOverviewFrame:
+    def test_formats_rows_in_order(self):
+        decisions = [
+            {"ticker": "AAPL", "company_name": "Apple Inc. and a very long suffix", "sector": None,
+             "action": "STRONG_BUY", "composite_score": 31.25, "confidence": 0.8,
+             "position_size_pct": 4.0, "decided_at": "2024-05-01 10:00:00",
+             "_ext": {"price_targets": {"upside_pct": 12.0}}},
+            {"ticker": "MSFT", "company_name": None, "sector": "Technology",
+             "action": "HOLD", "composite_score": -2.0, "confidence": None,
+             "position_size_pct": 0, "decided_at": "2024-05-02 10:00:00", "_ext": {}},
+        ]
+        df = _overview_frame(decisions)
+        assert df.to_dict("records") == [
+            {"Ticker": "AAPL", "Company": "Apple Inc. and a very lon", "Sector": "",
+             "Action": "STRONG BUY", "Score": "+31.2", "Confidence": "80%", "Position": "4.0%",
+             "Upside": "+12.0%", "Date": "2024-05-01"},
+            {"Ticker": "MSFT", "Company": "", "Sector": "Technology",
+             "Action": "HOLD", "Score": "-2.0", "Confidence": "N/A", "Position": "-",
+             "Upside": "-", "Date": "2024-05-02"},
+        ]
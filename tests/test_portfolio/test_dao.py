@@ -1,5 +1,6 @@
 """Tests for database DAO operations."""
 
+import numpy as np
 import pytest
 
 
@@ -19,6 +20,12 @@ class TestStockDAO:
         assert result["company_name"] == "Apple Inc. Updated"
         assert result["sector"] == "Technology"  # Preserved from first insert
 
+    def test_get_sectors(self, stock_dao, sample_stock):
+        stock_dao.upsert(**sample_stock)
+        stock_dao.upsert(ticker="MSFT", company_name="Microsoft")
+        assert stock_dao.get_sectors(["AAPL", "MSFT", "NVDA"]) == {"AAPL": "Technology"}
+        assert stock_dao.get_sectors([]) == {}
+
     def test_get_all_active(self, stock_dao):
         stock_dao.upsert(ticker="AAPL", company_name="Apple")
         stock_dao.upsert(ticker="MSFT", company_name="Microsoft")
@@ -47,6 +54,31 @@ class TestStockDAO:
         result = stock_dao.get("NONEXISTENT")
         assert result is None
 
+    def test_upsert_many_merges_like_upsert(self, stock_dao, sample_stock):
+        stock_dao.upsert(**sample_stock)
+        stock_dao.upsert_many([
+            {"ticker": "AAPL", "company_name": "Apple Inc. Updated"},
+            {"ticker": "msft", "company_name": "Microsoft", "sector": "Technology"},
+        ])
+        aapl = stock_dao.get("AAPL")
+        assert aapl["company_name"] == "Apple Inc. Updated"
+        assert aapl["sector"] == "Technology"  # Preserved from first insert
+        assert stock_dao.get("MSFT")["company_name"] == "Microsoft"
+
+    def test_upsert_many_rejects_invalid_ticker(self, stock_dao):
+        with pytest.raises(ValueError):
+            stock_dao.upsert_many([{"ticker": "AAPL"}, {"ticker": "NOT A TICKER"}])
+        assert stock_dao.get("AAPL") is None
+
+
+class TestUserWatchlistDAO:
+    def test_add_many(self, user_watchlist_dao):
+        user_watchlist_dao.add(1, "AAPL")
+        user_watchlist_dao.add_many(1, ["aapl", "MSFT", "NVDA"])
+        user_watchlist_dao.add_many(2, ["TSLA"])
+        assert user_watchlist_dao.get_tickers(1) == ["AAPL", "MSFT", "NVDA"]
+        assert user_watchlist_dao.get_tickers(2) == ["TSLA"]
+
 
 class TestPriceDAO:
     def test_upsert_many_and_get(self, price_dao, sample_price_history):
@@ -97,6 +129,14 @@ class TestPortfolioDAO:
         assert len(holdings) == 1
         assert holdings[0]["ticker"] == "MSFT"
 
+    def test_snapshot_with_invalid_ticker_writes_nothing(self, portfolio_dao):
+        with pytest.raises(ValueError):
+            portfolio_dao.snapshot_holdings([
+                {"ticker": "AAPL", "quantity": 10},
+                {"ticker": "NOT A TICKER", "quantity": 5},
+            ])
+        assert list(portfolio_dao.get_latest_holdings()) == []
+
     def test_insert_snapshot(self, portfolio_dao):
         portfolio_dao.insert_snapshot(
             total_equity=100000, cash=5000,
@@ -159,6 +199,14 @@ class TestDecisionDAO:
         assert ext["conviction_score"] == 50
         assert len(ext["horizons"]) == 1
 
+    def test_get_latest_for_tickers(self, decision_dao):
+        for ticker, action in [("AAPL", "HOLD"), ("AAPL", "BUY"), ("MSFT", "SELL"), ("NVDA", "BUY")]:
+            decision_dao.insert({"ticker": ticker, "action": action,
+                                 "composite_score": 1.0, "confidence": 0.5})
+        rows = decision_dao.get_latest_for_tickers(["AAPL", "MSFT"])
+        assert {r["ticker"]: r["action"] for r in rows} == {"AAPL": "BUY", "MSFT": "SELL"}
+        assert decision_dao.get_latest_for_tickers([]) == []
+
 
 class TestInsiderTradeDAO:
     def test_insert_and_get_recent(self, insider_trade_dao, sample_insider_trades):
@@ -267,3 +315,60 @@ class TestRecurringInvestmentDAO:
         assert result["total_invested"] == 200.0
         assert result["total_shares_bought"] == 1.1
         assert result["num_executions"] == 2
+
+
+class TestNewsDAO:
+    def test_insert_many_skips_duplicates_and_bad_rows(self, news_dao, test_db):
+        articles = [
+            {"title": "A", "source": "Reuters", "url": "https://x/a", "ticker": "AAPL"},
+            {"title": "B", "source": "Bloomberg", "url": "https://x/b", "ticker": "MSFT"},
+            {"title": "A again", "source": "Reuters", "url": "https://x/a", "ticker": "AAPL"},
+            {"source": "Reuters", "url": "https://x/c"},  # no title
+        ]
+        assert news_dao.insert_many(articles) == 2
+        rows = test_db.execute("SELECT title, credibility_weight FROM news_articles ORDER BY title")
+        assert [r["title"] for r in rows] == ["A", "B"]
+        assert rows[0]["credibility_weight"] == 0.7
+
+    def test_get_latest_by_category(self, news_dao):
+        news_dao.insert_many([
+            {"title": f"{t} {d}", "source": "Reuters", "url": f"https://x/{t}/{d}",
+             "ticker": t, "published_at": f"2024-01-0{d} 09:00:00"}
+            for t in ("AAPL", "SPY", "GLD") for d in range(1, 5)
+        ])
+        result = news_dao.get_latest_by_category({
+            "portfolio": (["AAPL"], 1),
+            "market": (["SPY"], 2),
+            "political": (["GLD", "SPY"], 1),
+            "empty": ([], 5),
+        })
+        assert [r["title"] for r in result["portfolio"]] == ["AAPL 4"]
+        assert [r["title"] for r in result["market"]] == ["SPY 4", "SPY 3"]
+        assert sorted(r["title"] for r in result["political"]) == ["GLD 4", "SPY 4"]
+        assert result["empty"] == []
+        assert "cat" not in result["market"][0]
+
+    def test_insert_many_empty(self, news_dao, test_db):
+        assert news_dao.insert_many([]) == 0
+        assert test_db.execute_one("SELECT COUNT(*) AS n FROM news_articles")["n"] == 0
+
+
+class TestMacroDAO:
+    def test_get_series_columns(self, macro_dao):
+        for day in range(1, 5):
+            macro_dao.upsert("VIXCLS", "VIX", f"2024-01-0{day}", 10.0 + day)
+        dates, values = macro_dao.get_series_columns("VIXCLS", limit=3)
+        assert dates.dtype == np.dtype("datetime64[D]")
+        assert values.dtype == np.float32
+        assert list(dates.astype(str)) == ["2024-01-02", "2024-01-03", "2024-01-04"]
+        assert list(values) == [12.0, 13.0, 14.0]
+
+    def test_get_last_fetched(self, macro_dao, test_db):
+        macro_dao.upsert("DGS10", "10Y", "2024-01-01", 4.0)
+        test_db.execute_insert(
+            "UPDATE macro_indicators SET fetched_at = '2024-01-01 00:00:00' WHERE series_id = 'DGS10'"
+        )
+        before = macro_dao.get_last_fetched(["DGS10", "DGS2"])
+        assert before == {"DGS10": "2024-01-01 00:00:00"}
+        macro_dao.upsert("DGS10", "10Y", "2024-01-01", 4.1)
+        assert macro_dao.get_last_fetched(["DGS10"])["DGS10"] > before["DGS10"]
@@ -0,0 +1,78 @@
+"""Tests for applying live quotes to portfolio holdings and summarizing them."""
+
+import math
+
+import pandas as pd
+
+from dashboard.views.portfolio import _apply_live_prices, _holdings_frame, _quotes_from_closes
+
+
+class TestApplyLivePrices:
+    def test_recalculates_pl(self, sample_holdings):
+        live = {"AAPL": {"price": 200.0, "change": 2.0, "change_pct": 1.0}}
+        result = _apply_live_prices(sample_holdings, live)
+        aapl = result[0]
+        assert aapl["current_price"] == 200.0
+        assert aapl["market_value"] == 20000.0
+        assert aapl["unrealized_pl"] == 5000.0
+        assert math.isclose(aapl["unrealized_pl_pct"], 33.333, rel_tol=1e-3)
+        assert aapl["_daily_change"] == 2.0
+        assert aapl["_daily_change_pct"] == 1.0
+
+    def test_holdings_without_quotes_unchanged(self, sample_holdings):
+        live = {"AAPL": {"price": 200.0, "change": 2.0, "change_pct": 1.0}}
+        result = _apply_live_prices(sample_holdings, live)
+        assert result[1] == sample_holdings[1]
+        assert result[2] == sample_holdings[2]
+
+    def test_does_not_mutate_input(self, sample_holdings):
+        live = {"MSFT": {"price": 400.0, "change": 0, "change_pct": 0}}
+        _apply_live_prices(sample_holdings, live)
+        assert sample_holdings[1]["current_price"] == 350.0
+        assert "_daily_change" not in sample_holdings[1]
+
+    def test_skips_nan_price(self, sample_holdings):
+        live = {"AAPL": {"price": float("nan"), "change": 0, "change_pct": 0}}
+        result = _apply_live_prices(sample_holdings, live)
+        assert result[0]["current_price"] == 175.0
+
+    def test_zero_cost_gives_zero_pl(self):
+        holdings = [{"ticker": "GIFT", "quantity": 10, "average_cost": 0}]
+        live = {"GIFT": {"price": 50.0, "change": 1.0, "change_pct": 2.0}}
+        result = _apply_live_prices(holdings, live)
+        assert result[0]["market_value"] == 500.0
+        assert result[0]["unrealized_pl"] == 0
+        assert result[0]["unrealized_pl_pct"] == 0
+
+    def test_empty_holdings(self):
+        assert _apply_live_prices([], {"AAPL": {"price": 1.0}}) == []
+
+
+class TestHoldingsFrame:
+    def test_coerces_bad_values_to_zero(self):
+        df = _holdings_frame([
+            {"ticker": "A", "quantity": 2, "market_value": float("nan"), "unrealized_pl": "n/a", "sector": None},
+            {"ticker": "B", "quantity": 3, "average_cost": 10, "market_value": 30, "sector": "Tech"},
+        ])
+        assert df["market_value"].tolist() == [0.0, 30.0]
+        assert df["unrealized_pl"].tolist() == [0.0, 0.0]
+        assert df["_daily_change"].tolist() == [0.0, 0.0]  # missing column
+        assert df["sector"].tolist() == ["", "Tech"]
+        assert (df["average_cost"] * df["quantity"]).sum() == 30.0
+
+
+class TestQuotesFromCloses:
+    def test_uses_each_tickers_last_two_closes(self):
+        nan = float("nan")
+        close = pd.DataFrame({
+            "AAPL": [100.0, 110.0, nan],
+            "MSFT": [200.0, 190.0, 180.0],
+            "ONE": [nan, nan, 50.0],
+            "DEAD": [nan, nan, nan],
+        })
+        quotes = _quotes_from_closes(close)
+        assert quotes["AAPL"]["price"] == 110.0
+        assert math.isclose(quotes["AAPL"]["change_pct"], 10.0)
+        assert quotes["MSFT"]["change"] == -10.0
+        assert quotes["ONE"] == {"price": 50.0, "change": 0.0, "change_pct": 0.0}
+        assert "DEAD" not in quotes